@@ -0,0 +1 @@
+"""Scale benchmarks for the dealership core; run with ``python -m benchmarks.run``."""
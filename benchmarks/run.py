@@ -0,0 +1,255 @@
+"""Time the dealership's hot paths on synthetic data and compare with a baseline.
+
+    python -m benchmarks.run                         # 10k, 100k and 1M, compared with baseline.json
+    python -m benchmarks.run --sizes 10000 --output results.json
+    python -m benchmarks.run --save-baseline         # record this machine's numbers as the baseline
+
+Each run repeats a benchmark until it has taken at least MIN_RUN_SECONDS, as
+timeit.autorange does, and records the time per call; a benchmark reports the
+best of --repeat runs. A benchmark is flagged as
+a regression when it is more than --tolerance slower than the baseline; the
+exit status is 1 if any are.
+"""
+import argparse
+import json
+import os
+import platform
+import random
+import sys
+import time
+from datetime import datetime
+
+from dealership_core import AppointmentBook, InventoryStore, LeaseQuote, SalesAssigner, ServiceCapacity
+from dealership_core.appointments import BUSINESS_HOURS, SALES_SHIFTS, SALESMEN, SERVICE_BAYS
+from dealership_core.financing import FINANCING_TERMS, monthly_payment, quote_matrix
+from dealership_core.inventory_index import item_matches
+from dealership_core.leasing import lease_payments, reprice_lease_quotes
+from dealership_core.quote_cache import financing_cache, financing_payment
+
+from .synthetic import FIRST_DAY, appointment_slots, search_queries, synthetic_vehicles
+
+DEFAULT_SIZES = [10000, 100000, 1000000]
+BASELINE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baseline.json")
+# Queries per search benchmark; the linear scan only runs the first few, it is the slow reference.
+SEARCH_QUERIES = 50
+LINEAR_SCAN_QUERIES = 5
+OPEN_SLOT_QUERIES = 1000
+# Timed work per run; millisecond benchmarks are repeated up to this so noise does not swamp them.
+MIN_RUN_SECONDS = 0.2
+
+BENCHMARKS = []   # (name, function(dataset) -> seconds)
+
+
+def benchmark(name):
+    def register(fn):
+        BENCHMARKS.append((name, fn))
+        return fn
+    return register
+
+
+def timed(fn, *args, setup=None):
+    """Seconds per call of fn(*args), calling it until MIN_RUN_SECONDS have been timed.
+
+    setup, if given, runs untimed before every call and its result is passed
+    to fn first, for benchmarks that need fresh state each call.
+    """
+    total = 0.0
+    calls = 0
+    while total < MIN_RUN_SECONDS:
+        call_args = args if setup is None else (setup(), *args)
+        started = time.perf_counter()
+        fn(*call_args)
+        total += time.perf_counter() - started
+        calls += 1
+    return total / calls
+
+
+class Dataset:
+    """Synthetic data for one size, built once and shared by every benchmark."""
+
+    def __init__(self, size):
+        self.size = size
+        self.vehicles = synthetic_vehicles(size)
+        self.prices = [vehicle.price for vehicle in self.vehicles]
+        self.store = InventoryStore()
+        self.store.add_many(self.vehicles)
+        self.queries = search_queries(count=SEARCH_QUERIES)
+
+
+@benchmark("inventory_add")
+def bench_inventory_add(data):
+    return timed(lambda store: store.add_many(data.vehicles), setup=InventoryStore)
+
+
+@benchmark("inventory_search")
+def bench_inventory_search(data):
+    return timed(lambda: [data.store.search(*query) for query in data.queries])
+
+
+@benchmark("inventory_linear_scan")
+def bench_inventory_linear_scan(data):
+    """The pre-index search: every filter tested against every vehicle."""
+    queries = data.queries[:LINEAR_SCAN_QUERIES]
+    return timed(lambda: [[v for v in data.vehicles if item_matches(v, *query)] for query in queries])
+
+
+@benchmark("inventory_grid_render")
+def bench_inventory_grid_render(data):
+    """refresh_inventory_display on a withdrawn root; skipped (None) without a display."""
+    import tkinter as tk
+    try:
+        root = tk.Tk()
+    except tk.TclError:
+        return None
+    from inventory_grid import VirtualInventoryGrid
+    try:
+        root.withdraw()
+        grid = VirtualInventoryGrid(root, on_financing=print, on_lease=print)
+        grid.pack(fill="both", expand=True)
+        root.geometry("1200x800")
+        root.update()
+
+        def render():
+            grid.set_items(data.store)
+            grid.yview("moveto", 0.5)
+            root.update_idletasks()
+        return timed(render)
+    finally:
+        root.destroy()
+
+
+@benchmark("financing_scalar")
+def bench_financing_scalar(data):
+    return timed(lambda: [monthly_payment(price - 5000, 60, 3.5) for price in data.prices])
+
+
+@benchmark("financing_cached")
+def bench_financing_cached(data):
+    """The popup path: payments through the bounded LRU, cold cache."""
+    return timed(lambda _: [financing_payment(price - 5000, 60, 3.5) for price in data.prices],
+                 setup=financing_cache.clear)
+
+
+@benchmark("financing_matrix")
+def bench_financing_matrix(data):
+    return timed(quote_matrix, data.prices, [0, 5000], FINANCING_TERMS, [3.5])
+
+
+@benchmark("lease_vectorized")
+def bench_lease_vectorized(data):
+    return timed(lease_payments, data.prices, 3000, 36, 3.5)
+
+
+@benchmark("lease_reprice")
+def bench_lease_reprice(data):
+    quotes = [LeaseQuote(0.0, 36, 3.5, price=price, money_down=3000, residual_pct=55.0, acquisition_fee=895.0)
+              for price in data.prices]
+    return timed(reprice_lease_quotes, quotes, 4.9)
+
+
+@benchmark("service_booking")
+def bench_service_booking(data):
+    slots = appointment_slots(data.size, BUSINESS_HOURS, len(SERVICE_BAYS))
+    return timed(lambda capacity: [capacity.reserve({}, day, hour) for day, hour in slots],
+                 setup=lambda: ServiceCapacity(AppointmentBook(SERVICE_BAYS)))
+
+
+@benchmark("sales_booking")
+def bench_sales_booking(data):
+    slots = appointment_slots(data.size, BUSINESS_HOURS, len(SALESMEN))
+    return timed(lambda assigner: [assigner.assign({}, day, hour) for day, hour in slots],
+                 setup=lambda: SalesAssigner(AppointmentBook(SALESMEN), SALES_SHIFTS))
+
+
+@benchmark("service_open_slots")
+def bench_service_open_slots(data):
+    """Earliest-opening queries over a fully booked calendar, the worst case."""
+    capacity = ServiceCapacity(AppointmentBook(SERVICE_BAYS))
+    slots = appointment_slots(data.size, BUSINESS_HOURS, len(SERVICE_BAYS))
+    for day, hour in slots:
+        capacity.reserve({}, day, hour)
+    rng = random.Random(0)
+    booked_days = (slots[-1][0] - FIRST_DAY).days + 1
+    starts = [FIRST_DAY.toordinal() + rng.randrange(booked_days) for _ in range(OPEN_SLOT_QUERIES)]
+    return timed(lambda: [capacity.open_slots(datetime.fromordinal(start), 10, 2) for start in starts])
+
+
+def run(sizes, repeat, only=None):
+    results = []
+    for size in sizes:
+        print(f"Generating {size:,} synthetic vehicles...", file=sys.stderr)
+        data = Dataset(size)
+        for name, fn in BENCHMARKS:
+            if only and name not in only:
+                continue
+            times = [fn(data) for _ in range(repeat)]
+            if times[0] is None:
+                print(f"  {name:<24} {size:>9,}  skipped", file=sys.stderr)
+                results.append({"name": name, "size": size, "seconds": None, "skipped": True})
+                continue
+            best = min(times)
+            print(f"  {name:<24} {size:>9,}  {best * 1000:10.1f} ms", file=sys.stderr)
+            results.append({"name": name, "size": size, "seconds": best})
+    return {
+        "meta": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "created": datetime.now().isoformat(timespec="seconds"),
+            "repeat": repeat,
+        },
+        "results": results,
+    }
+
+
+def compare(report, baseline, tolerance):
+    """Return [(name, size, baseline seconds, seconds, ratio)] for results slower than the tolerance allows."""
+    known = {(r["name"], r["size"]): r["seconds"] for r in baseline["results"] if r.get("seconds")}
+    regressions = []
+    for result in report["results"]:
+        before = known.get((result["name"], result["size"]))
+        if before is None or result["seconds"] is None:
+            continue
+        ratio = result["seconds"] / before
+        result["baseline_ratio"] = round(ratio, 3)
+        if ratio > 1 + tolerance:
+            regressions.append((result["name"], result["size"], before, result["seconds"], ratio))
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.run", description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--only", nargs="+", help="run just these benchmarks")
+    parser.add_argument("--output", help="write the JSON report here (default: stdout)")
+    parser.add_argument("--baseline", default=BASELINE_PATH)
+    parser.add_argument("--tolerance", type=float, default=0.25, help="allowed slowdown, 0.25 = 25%%")
+    parser.add_argument("--save-baseline", action="store_true", help="write the report to --baseline")
+    args = parser.parse_args(argv)
+
+    report = run(args.sizes, args.repeat, args.only)
+    regressions = []
+    if args.save_baseline:
+        with open(args.baseline, "w") as f:
+            json.dump(report, f, indent=2)
+            f.write("\n")
+        print("Baseline saved to", args.baseline, file=sys.stderr)
+    elif os.path.exists(args.baseline):
+        with open(args.baseline) as f:
+            regressions = compare(report, json.load(f), args.tolerance)
+        for name, size, before, after, ratio in regressions:
+            print(f"REGRESSION {name} at {size:,}: {before * 1000:.1f} ms -> {after * 1000:.1f} ms ({ratio:.2f}x)",
+                  file=sys.stderr)
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+            f.write("\n")
+    else:
+        json.dump(report, sys.stdout, indent=2)
+        print()
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
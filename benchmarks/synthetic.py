@@ -0,0 +1,48 @@
+import random
+from datetime import date, timedelta
+
+from dealership_core import Vehicle
+
+MAKES = ["Audi", "BMW", "Mercedes", "Volkswagen", "Porsche", "Toyota", "Honda", "Ford"]
+MODELS = {
+    "Audi": ["A3", "A4", "A6", "Q3", "Q5", "Q7", "e-tron GT", "RS 6 Avant"],
+    "BMW": ["330i", "530i", "X3", "X5", "M4 Competition", "i4"],
+    "Mercedes": ["C 300", "E 350", "GLC 300", "GLE 450", "AMG GT"],
+    "Volkswagen": ["Golf GTI", "Jetta", "Tiguan", "Atlas", "ID.4"],
+    "Porsche": ["911 Carrera", "Cayenne", "Macan", "Taycan"],
+    "Toyota": ["Camry", "Corolla", "RAV4", "Highlander", "Tacoma"],
+    "Honda": ["Civic", "Accord", "CR-V", "Pilot"],
+    "Ford": ["F-150", "Mustang", "Explorer", "Bronco Sport"],
+}
+TYPES = ["New", "Used"]
+# Monday the synthetic appointment calendar starts on
+FIRST_DAY = date(2025, 1, 6)
+
+
+def synthetic_vehicles(count, seed=0):
+    """count Vehicles with unique VINs and a realistic spread of makes, models, years and prices."""
+    rng = random.Random(seed)
+    vehicles = []
+    for i in range(count):
+        make = rng.choice(MAKES)
+        vehicles.append(Vehicle(rng.choice(TYPES), make, rng.choice(MODELS[make]), rng.randint(2010, 2025),
+                                f"SYN{i:014d}", float(rng.randint(15000, 150000))))
+    return vehicles
+
+
+def search_queries(seed=0, count=50):
+    """(make, model, type, year) filters in the shape the Inventory tab search sends."""
+    rng = random.Random(seed)
+    queries = []
+    for _ in range(count):
+        make = rng.choice(MAKES + ["all"])
+        model = rng.choice(MODELS[make])[:rng.randint(1, 4)].lower() if make != "all" and rng.random() < 0.6 else ""
+        queries.append((make.lower(), model, rng.choice(["all", "new", "used"]),
+                        str(rng.randint(2010, 2025)) if rng.random() < 0.4 else ""))
+    return queries
+
+
+def appointment_slots(count, hours, resources):
+    """count (day, hour) pairs that fill every resource in every hour, day after day."""
+    per_day = len(hours) * resources
+    return [(FIRST_DAY + timedelta(days=i // per_day), hours[(i // resources) % len(hours)]) for i in range(count)]
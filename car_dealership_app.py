@@ -1,21 +1,46 @@
+import time
+# Cold-start clock: taken before the other imports, whose cost is part of startup
+STARTUP_T0 = time.perf_counter()
+
+import os
 import tkinter as tk
-from tkinter import ttk, messagebox
-import random
-from tkcalendar import Calendar
-from datetime import datetime
-
-# Fixed week view: Monday, Jan 6, 2025 to Sunday, Jan 12, 2025
-WEEK_DATES = [
-    ("M", "06-Jan-2025"),
-    ("T", "07-Jan-2025"),
-    ("W", "08-Jan-2025"),
-    ("T", "09-Jan-2025"),
-    ("F", "10-Jan-2025"),
-    ("S", "11-Jan-2025"),
-    ("S", "12-Jan-2025")
-]
+from tkinter import ttk, messagebox, filedialog
+import itertools
+import math
+from datetime import date, datetime, timedelta
+from dealership_core import DealershipCore, SERVICE_JOB_HOURS, SlotConflictError
+from dealership_core.appointments import slot_date, week_days, week_start
+from dealership_core.dealership_db import DealershipDatabase
+from dealership_core.financing import FINANCING_TERMS, QuoteTable, amortization_schedule, export_schedules_csv
+from dealership_core.inventory_index import item_matches
+from dealership_core.leasing import DEFAULT_ACQUISITION_FEE, DEFAULT_RESIDUAL_PCT, DEFAULT_TAX_RATE, LEASE_TERMS
+from dealership_core.quote_cache import cache_stats
+from dialog_pool import DialogPool
+from inventory_grid import VirtualInventoryGrid
+from job_scheduler import JobScheduler
+from schedule_canvas import CanvasScheduleGrid
+
+# Print startup and first tab build times, for profiling: DEALERSHIP_REPORT_TIMINGS=1
+REPORT_TIMINGS = os.environ.get("DEALERSHIP_REPORT_TIMINGS", "") not in ("", "0")
+# Day letters for the scheduling grid headers, Monday first
+DAY_LETTERS = "MTWTFSS"
 # Time slots from 08:00 to 18:00 (inclusive)
 TIME_SLOTS = [f"{h:02d}:00" for h in range(8, 19)]
+# Earliest service openings offered by the service appointment popup
+OPEN_SLOT_COUNT = 10
+# Scheduling grid renderer: "canvas" draws a week on one canvas, "frames" uses a widget per cell
+SCHEDULE_RENDERER = "canvas"
+# Quiet period after the last keystroke before a live inventory search runs
+LIVE_SEARCH_DELAY_MS = 250
+# Most quote matrix rows shown at once; the full matrix is still sorted as a whole
+MATRIX_DISPLAY_LIMIT = 1000
+MATRIX_ALL_VEHICLES = "All vehicles"
+# Amortization schedule rows pulled from the generator per "Load More"
+SCHEDULE_PAGE_SIZE = 24
+# Inventories at least this large are searched on a worker thread
+BACKGROUND_SEARCH_MIN_ITEMS = 20000
+# Queued database writes are flushed together this long after the latest change
+DB_FLUSH_DELAY_MS = 500
 
 
 class CarDealershipApp:
@@ -44,29 +69,152 @@ class CarDealershipApp:
         self.notebook.add(self.inventory_tab, text="Inventory Management")
         self.notebook.add(self.manager_financing_tab, text="Manager Financing & Lease Options")
 
-        # Data stores
-        self.service_appointments = []   # list of dicts for service
-        self.sales_appointments = []     # list of dicts for sales
-        self.inventory_items = []        # list of dicts for inventory; each item will include financing and lease options
-
-        # Build scheduling grids (each is a weekly view)
+        # Worker pools for long operations; results come back through root.after
+        self.jobs = JobScheduler(root)
+        # Popups are built once and re-shown with their fields reset
+        self.dialogs = DialogPool(root)
+        self.root.protocol("WM_DELETE_WINDOW", self.on_close)
+
+        # Data stores: inventory, quotes and appointments live in the headless core;
+        # it persists through the Django project's database when Django is available.
+        try:
+            db = DealershipDatabase()
+        except ImportError as e:
+            print("Database unavailable, running without persistence:", e)
+            db = None
+        self.core = DealershipCore(db)
+        self.inventory = self.core.inventory  # typed Vehicle records plus search index; each holds its financing and lease quotes
+        # Monday of the week each scheduling grid is showing
+        self.week_starts = {"service": week_start(date.today()), "sales": week_start(date.today())}
+        self.week_labels = {}
+        self.grid_headers = {}
+        self.schedule_canvases = {}      # sched_type -> CanvasScheduleGrid when SCHEDULE_RENDERER is "canvas"
+        self.vin_combo_sizes = {}        # VIN dropdown widget name -> number of VINs last loaded into it
+        self.inv_search_filters = None   # active (make, model, type, year) search, or None when showing everything
+        self.inv_search_after_id = None  # pending debounced live search, if any
+        self.inv_search_job = None       # background search whose results are still awaited
+        self.inv_import_job = None
+
+        # Each tab is built the first time it is selected; only the first one is built now.
+        self.tab_builders = {
+            str(self.service_tab): self.build_service_tab,
+            str(self.sales_tab): self.build_sales_tab,
+            str(self.inventory_tab): self.build_inventory_view,
+            str(self.manager_financing_tab): self.build_manager_financing_view,
+        }
+        self.notebook.bind("<<NotebookTabChanged>>", self.build_selected_tab)
+        self.build_selected_tab()
+
+        self.db_flush_after_id = None
+        if self.core.db is not None:
+            self.load_appointments()
+            self.root.after(0, self.load_next_inventory_page, self.core.load_inventory_pages())
+        self.startup_seconds = None
+        self.root.after_idle(self.report_startup_time)
+
+    def report_startup_time(self):
+        """Record cold-start latency: module import to the first idle mainloop pass."""
+        self.startup_seconds = time.perf_counter() - STARTUP_T0
+        if REPORT_TIMINGS:
+            print(f"Startup time: {self.startup_seconds * 1000:.0f} ms")
+
+    def build_selected_tab(self, event=None):
+        builder = self.tab_builders.pop(self.notebook.select(), None)
+        if builder is None:
+            return
+        t0 = time.perf_counter()
+        builder()
+        if REPORT_TIMINGS:
+            tab_name = self.notebook.tab(self.notebook.select(), 'text')
+            print(f"Built tab {tab_name!r} in {(time.perf_counter() - t0) * 1000:.0f} ms")
+
+    def build_service_tab(self):
+        # Scheduling grid (a weekly view) with its "Add Appointment" button below
         self.build_scheduling_grid(self.service_tab, "service")
-        self.build_scheduling_grid(self.sales_tab, "sales")
-
-        # Add "Add Appointment" buttons above each scheduling grid
         ttk.Button(self.service_tab, text="Add Service Appointment", command=self.open_service_appointment_popup)\
             .pack(pady=5)
+
+    def build_sales_tab(self):
+        self.build_scheduling_grid(self.sales_tab, "sales")
         ttk.Button(self.sales_tab, text="Add Sales Appointment", command=self.open_sales_appointment_popup)\
             .pack(pady=5)
+        ttk.Button(self.sales_tab, text="Salesman Utilization", command=self.show_sales_utilization)\
+            .pack(pady=5)
 
-        # Build Inventory Management view (with search and add new inventory)
-        self.build_inventory_view()
-
-        # Build Manager Financing & Lease Options view
-        self.build_manager_financing_view()
+    def load_appointments(self):
+        self.core.load_appointments()
+        # Only the visible week gets widgets.
+        self.show_week("service", self.week_starts["service"])
+        self.show_week("sales", self.week_starts["sales"])
+
+    def load_next_inventory_page(self, pages):
+        """Load one page of saved inventory, then yield to the mainloop for the next."""
+        added = next(pages, None)
+        if added is None:
+            print("Inventory loaded. Total items now:", len(self.inventory))
+            return
+        for vehicle in added:
+            self.show_added_vehicle(vehicle)
+            # An unbuilt manager tab fills its trees from the store when first shown.
+            if vehicle.financing_options and hasattr(self, 'manager_financing_tree'):
+                self.update_manager_tree_row(self.manager_financing_tree, vehicle.vin, vehicle.financing_options)
+            if vehicle.lease_options and hasattr(self, 'manager_lease_tree'):
+                self.update_manager_tree_row(self.manager_lease_tree, vehicle.vin, vehicle.lease_options)
+        self.root.after(1, self.load_next_inventory_page, pages)
+
+    def schedule_db_flush(self):
+        """Batch writes: flush once the user pauses instead of on every change."""
+        if self.core.db is None:
+            return
+        if self.db_flush_after_id is not None:
+            self.root.after_cancel(self.db_flush_after_id)
+        self.db_flush_after_id = self.root.after(DB_FLUSH_DELAY_MS, self.flush_database)
+
+    def flush_database(self):
+        self.db_flush_after_id = None
+        try:
+            skipped = self.core.flush()
+        except Exception as e:
+            messagebox.showerror("Database Error", f"Could not save changes: {e}")
+            return
+        if skipped:
+            messagebox.showwarning("Database Warning",
+                                   f"Not saved, VIN already in the database: {', '.join(skipped)}")
+
+    def on_close(self):
+        self.jobs.shutdown()
+        if self.core.db is not None:
+            if self.db_flush_after_id is not None:
+                self.root.after_cancel(self.db_flush_after_id)
+            self.flush_database()
+        self.root.destroy()
 
     def build_scheduling_grid(self, parent, sched_type):
-        """Create a grid view with 7 columns (days) and rows for time slots."""
+        """Create a grid view with 7 columns (days) and rows for time slots.
+
+        The grid shows one week at a time; navigating relabels the headers and
+        repopulates the same cells from the appointment book's date index.
+        With the canvas renderer the whole week is drawn on one CanvasScheduleGrid.
+        """
+        nav_frame = ttk.Frame(parent)
+        nav_frame.pack(fill="x", padx=10, pady=(10, 0))
+        ttk.Button(nav_frame, text="< Previous Week", command=lambda: self.shift_week(sched_type, -1))\
+            .pack(side="left")
+        ttk.Button(nav_frame, text="This Week", command=lambda: self.show_week(sched_type, week_start(date.today())))\
+            .pack(side="left", padx=5)
+        ttk.Button(nav_frame, text="Next Week >", command=lambda: self.shift_week(sched_type, 1))\
+            .pack(side="left")
+        self.week_labels[sched_type] = ttk.Label(nav_frame, text="", font=("Helvetica", 12, "bold"))
+        self.week_labels[sched_type].pack(side="left", padx=15)
+
+        if SCHEDULE_RENDERER == "canvas":
+            grid = CanvasScheduleGrid(parent, TIME_SLOTS,
+                                      on_click=lambda col, row, appointment: self.show_appointment_details(sched_type, appointment))
+            grid.pack(fill="both", expand=True, padx=10, pady=10)
+            self.schedule_canvases[sched_type] = grid
+            self.show_week(sched_type, self.week_starts[sched_type])
+            return
+
         grid_frame = ttk.Frame(parent)
         grid_frame.pack(fill="both", expand=True, padx=10, pady=10)
         if sched_type == "service":
@@ -74,12 +222,13 @@ class CarDealershipApp:
         else:
             self.sales_grid_cells = {}
 
-        # Header row: blank top-left cell, then day headers.
+        # Header row: blank top-left cell, then day headers (text set by show_week).
         ttk.Label(grid_frame, text="").grid(row=0, column=0, sticky="nsew", padx=1, pady=1)
-        for col, (day_letter, date_str) in enumerate(WEEK_DATES, start=1):
-            header_text = f"{day_letter}\n{date_str}"
-            ttk.Label(grid_frame, text=header_text, borderwidth=1, relief="solid", width=15)\
-                .grid(row=0, column=col, sticky="nsew", padx=1, pady=1)
+        self.grid_headers[sched_type] = []
+        for col in range(1, len(DAY_LETTERS)+1):
+            header = ttk.Label(grid_frame, text="", borderwidth=1, relief="solid", width=15)
+            header.grid(row=0, column=col, sticky="nsew", padx=1, pady=1)
+            self.grid_headers[sched_type].append(header)
 
         # Left column: time slots.
         for row, time_slot in enumerate(TIME_SLOTS, start=1):
@@ -88,7 +237,7 @@ class CarDealershipApp:
 
         # Create empty cells for each (day, time)
         for row in range(1, len(TIME_SLOTS)+1):
-            for col in range(1, len(WEEK_DATES)+1):
+            for col in range(1, len(DAY_LETTERS)+1):
                 cell = tk.Frame(grid_frame, borderwidth=1, relief="solid", width=150, height=50)
                 cell.grid(row=row, column=col, sticky="nsew", padx=1, pady=1)
                 if sched_type == "service":
@@ -97,14 +246,44 @@ class CarDealershipApp:
                     self.sales_grid_cells[(col, row)] = cell
 
         # Configure grid to expand equally.
-        for col in range(len(WEEK_DATES)+1):
+        for col in range(len(DAY_LETTERS)+1):
             grid_frame.columnconfigure(col, weight=1)
         for row in range(len(TIME_SLOTS)+1):
             grid_frame.rowconfigure(row, weight=1)
 
+        self.show_week(sched_type, self.week_starts[sched_type])
+
+    def shift_week(self, sched_type, weeks):
+        self.show_week(sched_type, self.week_starts[sched_type] + timedelta(weeks=weeks))
+
+    def show_week(self, sched_type, start):
+        """Point a scheduling grid at another week, reusing its header and cell widgets."""
+        self.week_starts[sched_type] = start
+        if sched_type not in self.week_labels:
+            return   # tab not built yet; it renders this week when it is
+        self.week_labels[sched_type].config(text=f"Week of {start:%d-%b-%Y}")
+        headers = [f"{DAY_LETTERS[day.weekday()]}\n{day:%d-%b-%Y}" for day in week_days(start)]
+        if sched_type == "service":
+            book, place = self.core.service_book, self.place_service_appointment
+        else:
+            book, place = self.core.sales_book, self.place_sales_appointment
+        if sched_type in self.schedule_canvases:
+            self.schedule_canvases[sched_type].set_week(headers)
+        else:
+            for header, text in zip(self.grid_headers[sched_type], headers):
+                header.config(text=text)
+            cells = self.service_grid_cells if sched_type == "service" else self.sales_grid_cells
+            for cell in cells.values():
+                for child in cell.winfo_children():
+                    child.destroy()
+        for appointment in book.appointments_in_week(start):
+            place(appointment)
+
     def open_service_appointment_popup(self):
-        """Pop-up for adding a service appointment with a calendar and hour dropdown."""
-        popup = tk.Toplevel(self.root)
+        self.dialogs.open("service", self.build_service_appointment_popup)
+
+    def build_service_appointment_popup(self, popup):
+        """Pop-up for adding a service appointment in one of the earliest open bay slots."""
         popup.title("Add Service Appointment")
 
         ttk.Label(popup, text="Customer Name:").grid(row=0, column=0, padx=5, pady=5, sticky="e")
@@ -115,51 +294,75 @@ class CarDealershipApp:
         vin_var = tk.StringVar()
         ttk.Entry(popup, textvariable=vin_var).grid(row=1, column=1, padx=5, pady=5)
 
-        ttk.Label(popup, text="Select Date:").grid(row=2, column=0, padx=5, pady=5, sticky="e")
-        cal = Calendar(popup, selectmode='day', year=2025, month=1, day=6)
-        cal.grid(row=2, column=1, padx=5, pady=5)
-
-        ttk.Label(popup, text="Select Hour:").grid(row=3, column=0, padx=5, pady=5, sticky="e")
-        hour_var = tk.StringVar()
-        hour_options = [f"{h:02d}:00" for h in range(8, 19)]
-        hour_combo = ttk.Combobox(popup, textvariable=hour_var, values=hour_options, state="readonly")
-        hour_combo.current(0)
-        hour_combo.grid(row=3, column=1, padx=5, pady=5)
+        ttk.Label(popup, text="Job Length (hours):").grid(row=2, column=0, padx=5, pady=5, sticky="e")
+        duration_var = tk.StringVar()
+        duration_combo = ttk.Combobox(popup, textvariable=duration_var, values=SERVICE_JOB_HOURS, state="readonly")
+        duration_combo.grid(row=2, column=1, padx=5, pady=5)
+
+        ttk.Label(popup, text="Earliest From:").grid(row=3, column=0, padx=5, pady=5, sticky="e")
+        from tkcalendar import Calendar   # deferred: only the appointment popups need it
+        cal = Calendar(popup, selectmode='day')
+        cal.grid(row=3, column=1, padx=5, pady=5)
+
+        ttk.Label(popup, text="Open Slots:").grid(row=4, column=0, padx=5, pady=5, sticky="ne")
+        slot_list = tk.Listbox(popup, height=OPEN_SLOT_COUNT, width=36, exportselection=False)
+        slot_list.grid(row=4, column=1, padx=5, pady=5)
+        slots = []
+
+        def refresh_slots(event=None):
+            picked = cal.selection_get() or date.today()
+            start = max(datetime.now(), datetime(picked.year, picked.month, picked.day))
+            slots[:] = self.core.open_service_slots(start, OPEN_SLOT_COUNT, int(duration_var.get()))
+            slot_list.delete(0, "end")
+            for day, hour, bay in slots:
+                slot_list.insert("end", f"{day:%a %d-%b-%Y} {hour:02d}:00 - {bay}")
+            if slots:
+                slot_list.selection_set(0)
+
+        duration_combo.bind("<<ComboboxSelected>>", refresh_slots)
+        cal.bind("<<CalendarSelected>>", refresh_slots)
+
+        def reset():
+            cust_var.set("")
+            vin_var.set("")
+            duration_combo.current(0)
+            shown = max(self.week_starts["service"], date.today())
+            cal.selection_set(shown)
+            cal.see(shown)
+            refresh_slots()
 
         def add_service():
             cust = cust_var.get().strip()
             vin = vin_var.get().strip()
-            date_selected = cal.get_date()  # returns string in mm/dd/yy format
-            hour = hour_var.get()
             if not cust or not vin:
                 messagebox.showerror("Input Error", "Please fill in all fields.")
                 return
+            if not slot_list.curselection():
+                messagebox.showerror("Input Error", "Please select an open slot.")
+                return
+            day, hour, bay = slots[slot_list.curselection()[0]]
             try:
-                dt = datetime.strptime(date_selected, "%m/%d/%y")
-            except Exception:
-                dt = datetime.strptime(date_selected, "%m/%d/%Y")
-            week_start = datetime(2025, 1, 6)
-            week_end = datetime(2025, 1, 12)
-            if dt < week_start or dt > week_end:
-                messagebox.showerror("Input Error", "Date must be within Jan 6-12, 2025 for this view.")
+                appointment = self.core.book_service(cust, vin, day, hour, bay, int(duration_var.get()))
+            except SlotConflictError as e:
+                messagebox.showerror("Slot Unavailable", str(e))
+                refresh_slots()
                 return
-            day_index = (dt - week_start).days  # 0 for Monday, etc.
-            col = day_index + 1
-            row = int(hour[:2]) - 8 + 1
-            appointment = {"customer": cust, "vin": vin, "date": dt, "hour": hour}
-            self.service_appointments.append(appointment)
-            cell = self.service_grid_cells.get((col, row))
-            if cell:
-                lbl = tk.Label(cell, text=f"{cust}\nVIN: {vin}\n{hour}", bg="lightblue", wraplength=140)
-                lbl.pack(expand=True, fill="both")
-            popup.destroy()
+            if week_start(day) == self.week_starts["service"]:
+                self.place_service_appointment(appointment)
+            else:
+                self.show_week("service", week_start(day))
+            self.schedule_db_flush()
+            popup.withdraw()
 
         ttk.Button(popup, text="Add Appointment", command=add_service)\
-            .grid(row=4, column=0, columnspan=2, pady=10)
+            .grid(row=5, column=0, columnspan=2, pady=10)
+        return reset
 
     def open_sales_appointment_popup(self):
+        self.dialogs.open("sales", self.build_sales_appointment_popup)
+
+    def build_sales_appointment_popup(self, popup):
         """Pop-up for adding a sales appointment (VIN removed; salesman auto-assigned)."""
-        popup = tk.Toplevel(self.root)
         popup.title("Add Sales Appointment")
 
         ttk.Label(popup, text="Customer Name:").grid(row=0, column=0, padx=5, pady=5, sticky="e")
@@ -167,16 +370,23 @@ class CarDealershipApp:
         ttk.Entry(popup, textvariable=cust_var).grid(row=0, column=1, padx=5, pady=5)
 
         ttk.Label(popup, text="Select Date:").grid(row=1, column=0, padx=5, pady=5, sticky="e")
-        cal = Calendar(popup, selectmode='day', year=2025, month=1, day=6)
+        from tkcalendar import Calendar
+        cal = Calendar(popup, selectmode='day')
         cal.grid(row=1, column=1, padx=5, pady=5)
 
         ttk.Label(popup, text="Select Hour:").grid(row=2, column=0, padx=5, pady=5, sticky="e")
         hour_var = tk.StringVar()
         hour_options = [f"{h:02d}:00" for h in range(8, 19)]
         hour_combo = ttk.Combobox(popup, textvariable=hour_var, values=hour_options, state="readonly")
-        hour_combo.current(0)
         hour_combo.grid(row=2, column=1, padx=5, pady=5)
 
+        def reset():
+            cust_var.set("")
+            hour_combo.current(0)
+            shown = self.week_starts["sales"]
+            cal.selection_set(shown)
+            cal.see(shown)
+
         def add_sales():
             cust = cust_var.get().strip()
             date_selected = cal.get_date()
@@ -188,26 +398,80 @@ class CarDealershipApp:
                 dt = datetime.strptime(date_selected, "%m/%d/%y")
             except Exception:
                 dt = datetime.strptime(date_selected, "%m/%d/%Y")
-            week_start = datetime(2025, 1, 6)
-            week_end = datetime(2025, 1, 12)
-            if dt < week_start or dt > week_end:
-                messagebox.showerror("Input Error", "Date must be within Jan 6-12, 2025 for this view.")
+            try:
+                appointment = self.core.book_sales(cust, dt, int(hour[:2]))
+            except SlotConflictError as e:
+                self.show_slot_conflict(self.core.sales_book, dt, int(hour[:2]), e)
                 return
-            day_index = (dt - week_start).days
-            col = day_index + 1
-            row = int(hour[:2]) - 8 + 1
-            salesmen = ["Chris", "Anthony", "Tyler", "Zach"]
-            salesman = random.choice(salesmen)
-            appointment = {"customer": cust, "date": dt, "hour": hour, "salesman": salesman}
-            self.sales_appointments.append(appointment)
-            cell = self.sales_grid_cells.get((col, row))
-            if cell:
-                lbl = tk.Label(cell, text=f"{cust}\n{hour}\nSales: {salesman}", bg="lightgreen", wraplength=140)
-                lbl.pack(expand=True, fill="both")
-            popup.destroy()
+            if week_start(dt) == self.week_starts["sales"]:
+                self.place_sales_appointment(appointment)
+            else:
+                self.show_week("sales", week_start(dt))
+            self.schedule_db_flush()
+            popup.withdraw()
 
         ttk.Button(popup, text="Add Appointment", command=add_sales)\
             .grid(row=3, column=0, columnspan=2, pady=10)
+        return reset
+
+    def show_sales_utilization(self):
+        """Report each salesman's booked share of their shift hours for the visible week."""
+        start = self.week_starts["sales"]
+        report = self.core.sales_assigner.utilization(start)
+        lines = [f"{name}: {booked}/{shift_hours} hours ({pct:.0f}%)" for name, (booked, shift_hours, pct) in report.items()]
+        messagebox.showinfo("Salesman Utilization", f"Week of {start:%d-%b-%Y}\n\n" + "\n".join(lines))
+
+    def show_slot_conflict(self, book, dt, hour, error):
+        """Reject a booking, pointing at the next open hour that day if there is one."""
+        next_hour = book.next_free_hour(dt, hour)
+        if next_hour is not None:
+            hint = f"The next opening that day is {next_hour:02d}:00."
+        else:
+            hint = "There are no later openings that day."
+        messagebox.showerror("Slot Unavailable", f"{error}\n{hint}")
+
+    def grid_cell_key(self, appointment, sched_type):
+        """Return the (col, row) grid cell of an appointment, or None outside the shown week."""
+        day_index = (slot_date(appointment["date"]) - self.week_starts[sched_type]).days  # 0 for Monday, etc.
+        if not 0 <= day_index < len(DAY_LETTERS):
+            return None
+        return day_index + 1, int(appointment["hour"][:2]) - 8 + 1
+
+    def place_service_appointment(self, appointment):
+        self.draw_appointment("service", appointment,
+                              f"{appointment['customer']}\nVIN: {appointment['vin']}\n{appointment['hour']} "
+                              f"({appointment.get('duration', 1)}h) {appointment['bay']}",
+                              "lightblue")
+
+    def place_sales_appointment(self, appointment):
+        self.draw_appointment("sales", appointment,
+                              f"{appointment['customer']}\n{appointment['hour']}\nSales: {appointment['salesman']}",
+                              "lightgreen")
+
+    def draw_appointment(self, sched_type, appointment, text, color):
+        """Show an appointment in its cell of the visible week, if it falls in it."""
+        key = self.grid_cell_key(appointment, sched_type)
+        if key is None:
+            return
+        if sched_type in self.schedule_canvases:
+            self.schedule_canvases[sched_type].add_appointment(key[0], key[1], appointment, text, color)
+            return
+        cells = self.service_grid_cells if sched_type == "service" else self.sales_grid_cells
+        lbl = tk.Label(cells[key], text=text, bg=color, wraplength=140)
+        lbl.pack(expand=True, fill="both")
+
+    def show_appointment_details(self, sched_type, appointment):
+        """Click handler for the canvas grid: describe the appointment under the pointer."""
+        if appointment is None:
+            return
+        lines = [f"Customer: {appointment['customer']}",
+                 f"Date: {appointment['date']:%d-%b-%Y} {appointment['hour']}"]
+        if sched_type == "service":
+            lines += [f"VIN: {appointment['vin']}", f"Bay: {appointment['bay']}",
+                      f"Length: {appointment.get('duration', 1)} hour(s)"]
+        else:
+            lines.append(f"Salesman: {appointment['salesman']}")
+        messagebox.showinfo("Appointment", "\n".join(lines))
 
     def build_inventory_view(self):
         """Build the Inventory Management view with search and a grid-of-boxes display."""
@@ -239,6 +503,12 @@ class CarDealershipApp:
 
         ttk.Button(search_frame, text="Search", command=self.search_inventory).grid(row=0, column=8, padx=5)
         ttk.Button(search_frame, text="Reset", command=self.reset_inventory_search).grid(row=0, column=9, padx=5)
+        self.inv_live_search_var = tk.BooleanVar(value=True)
+        ttk.Checkbutton(search_frame, text="Live", variable=self.inv_live_search_var)\
+            .grid(row=0, column=10, padx=5)
+        for var in (self.inv_search_make_var, self.inv_search_model_var,
+                    self.inv_search_type_var, self.inv_search_year_var):
+            var.trace_add("write", self.schedule_live_search)
 
         # Form for adding a new inventory item (now with Year)
         add_frame = ttk.LabelFrame(self.inventory_tab, text="Add New Inventory Item")
@@ -278,75 +548,54 @@ class CarDealershipApp:
         ttk.Button(add_frame, text="Add Inventory", command=self.add_inventory_item)\
             .grid(row=6, column=0, columnspan=2, pady=10)
 
-        # Display inventory items as boxes (grid layout)
-        self.inv_display_frame = ttk.Frame(self.inventory_tab)
-        self.inv_display_frame.pack(fill="both", expand=True, padx=10, pady=5)
+        # Bulk import of a CSV/JSONL feed, validated in chunks between Tk events
+        self.inv_import_button = ttk.Button(add_frame, text="Import CSV/JSONL...", command=self.start_inventory_import)
+        self.inv_import_button.grid(row=7, column=0, padx=5, pady=5)
+        self.inv_import_progress = ttk.Progressbar(add_frame, orient="horizontal", length=200, maximum=1.0)
+        self.inv_import_progress.grid(row=7, column=1, padx=5, pady=5)
+        self.inv_import_cancel_button = ttk.Button(add_frame, text="Cancel", command=self.cancel_inventory_import)
+        self.inv_import_cancel_button.grid(row=7, column=2, padx=5, pady=5)
+        self.inv_import_cancel_button.state(["disabled"])
+        self.inv_import_status = ttk.Label(add_frame, text="")
+        self.inv_import_status.grid(row=7, column=3, padx=5, pady=5, sticky="w")
+
+        # Display inventory items as boxes in a scrollable grid that only renders visible rows
+        self.inv_grid = VirtualInventoryGrid(self.inventory_tab,
+                                             on_financing=self.open_financing_options_for_item,
+                                             on_lease=self.open_lease_options_for_item)
+        self.inv_grid.pack(fill="both", expand=True, padx=10, pady=5)
         self.refresh_inventory_display()
 
     def refresh_inventory_display(self):
-        for widget in self.inv_display_frame.winfo_children():
-            widget.destroy()
-        cols = 3
-        for i, item in enumerate(self.inventory_items):
-            fin_options = "\n".join(item.get("financing_options", [])) if item.get("financing_options") else "N/A"
-            lease_options = "\n".join(item.get("lease_options", [])) if item.get("lease_options") else "N/A"
-            box_text = f"{item['make']} {item['model']} ({item.get('year', 'N/A')})"
-            box = ttk.LabelFrame(self.inv_display_frame, text=box_text, relief="solid")
-            box.grid(row=i // cols, column=i % cols, padx=5, pady=5, sticky="nsew")
-            info = f"Type: {item['type']}\nVIN: {item['vin']}\nPrice: {item['price']}\n\nFinancing:\n{fin_options}\n\nLease:\n{lease_options}"
-            ttk.Label(box, text=info, wraplength=200).pack(padx=5, pady=5)
-            btn_frame = ttk.Frame(box)
-            btn_frame.pack(padx=5, pady=5)
-            ttk.Button(btn_frame, text="Add Financing", command=lambda vin=item['vin']: self.open_financing_options_for_item(vin))\
-                .grid(row=0, column=0, padx=5)
-            ttk.Button(btn_frame, text="Add Lease", command=lambda vin=item['vin']: self.open_lease_options_for_item(vin))\
-                .grid(row=0, column=1, padx=5)
-        for c in range(cols):
-            self.inv_display_frame.columnconfigure(c, weight=1)
+        self.inv_grid.set_items(self.inventory)
 
     def add_inventory_item(self):
-            inv_item = {
+            fields = {
                 "type": self.inv_type_var.get().strip(),
                 "make": self.inv_make_var.get().strip(),
                 "model": self.inv_model_var.get().strip(),
                 "year": self.inv_year_var.get().strip(),
                 "vin": self.inv_vin_var.get().strip(),
-                "price": self.inv_price_var.get().strip(),
-                "financing_options": [],
-                "lease_options": []
+                "price": self.inv_price_var.get().strip()
             }
             # Debug print: show the inventory item
-            print("Attempting to add inventory item:", inv_item)
+            print("Attempting to add inventory item:", fields)
 
             # Check only the required fields that the user fills in.
-            required_fields = [
-                inv_item["type"],
-                inv_item["make"],
-                inv_item["model"],
-                inv_item["year"],
-                inv_item["vin"],
-                inv_item["price"]
-            ]
-            if not all(required_fields):
+            if not all(fields.values()):
                 messagebox.showerror("Input Error", "Please fill in all required fields for inventory item.")
                 print("Add inventory aborted: required fields missing.")
                 return
+            try:
+                vehicle = self.core.add_vehicle(**fields)  # rejects duplicate VINs
+            except ValueError as e:
+                messagebox.showerror("Input Error", str(e))
+                print("Add inventory aborted:", e)
+                return
 
-            self.inventory_items.append(inv_item)
-            print("Inventory item added. Total items now:", len(self.inventory_items))
-            self.refresh_inventory_display()
-
-            # Update manager financing and lease VIN dropdowns if available.
-            if hasattr(self, 'fin_vin_combo'):
-                vin_opts = [item['vin'] for item in self.inventory_items]
-                self.fin_vin_combo['values'] = vin_opts
-                if vin_opts:
-                    self.fin_vin_combo.current(0)
-            if hasattr(self, 'lease_vin_combo'):
-                vin_opts = [item['vin'] for item in self.inventory_items]
-                self.lease_vin_combo['values'] = vin_opts
-                if vin_opts:
-                    self.lease_vin_combo.current(0)
+            print("Inventory item added. Total items now:", len(self.inventory))
+            self.show_added_vehicle(vehicle)
+            self.schedule_db_flush()
 
             messagebox.showinfo("Inventory Added", "Inventory item added successfully.")
 
@@ -358,48 +607,152 @@ class CarDealershipApp:
             self.inv_vin_var.set("")
             self.inv_price_var.set("")
 
+    def show_added_vehicle(self, vehicle):
+        """Reflect one newly stored vehicle in the grid and the manager VIN dropdowns."""
+        # Append just the new card, unless the active search hides it or the tab is not built yet.
+        if hasattr(self, 'inv_grid') and (self.inv_search_filters is None or item_matches(vehicle, *self.inv_search_filters)):
+            self.inv_grid.append_item(vehicle)
+
+        # Manager VIN dropdowns load their lists when opened; just preselect the first VIN.
+        if hasattr(self, 'fin_vin_combo') and not self.fin_vin_var.get():
+            self.fin_vin_var.set(vehicle.vin)
+        if hasattr(self, 'lease_vin_combo') and not self.lease_vin_var.get():
+            self.lease_vin_var.set(vehicle.vin)
+
+    def start_inventory_import(self):
+        path = filedialog.askopenfilename(
+            title="Import Inventory",
+            filetypes=[("Inventory feeds", "*.csv *.jsonl *.ndjson"), ("All files", "*.*")])
+        if not path:
+            return
+        try:
+            inventory_import = self.core.open_import(path)
+        except OSError as e:
+            messagebox.showerror("Import Error", f"Could not open {path}: {e}")
+            return
+        print("Starting inventory import from", path)
+        self.inv_import_button.state(["disabled"])
+        self.inv_import_cancel_button.state(["!disabled"])
+        self.inv_import_progress["value"] = 0
+        self.inv_import_status.config(text="Validating...")
+
+        def validate(job, inventory_import):
+            for progress in inventory_import.steps():
+                job.check_cancelled()
+                job.report_progress(progress)
+            return inventory_import
+
+        self.inv_import_job = self.jobs.run_in_thread(
+            validate, inventory_import,
+            on_done=self.finish_inventory_import,
+            on_error=self.fail_inventory_import,
+            on_progress=lambda progress: self.show_import_progress(inventory_import, progress))
+
+    def show_import_progress(self, inventory_import, progress):
+        self.inv_import_progress["value"] = progress
+        self.inv_import_status.config(text=f"Validated {len(inventory_import.vehicles)} vehicles...")
+
+    def cancel_inventory_import(self):
+        if self.inv_import_job is not None:
+            self.inv_import_job.cancel()
+            self.inv_import_job = None
+        self.inv_import_button.state(["!disabled"])
+        self.inv_import_cancel_button.state(["disabled"])
+        self.inv_import_status.config(text="Import cancelled.")
+
+    def fail_inventory_import(self, error):
+        self.inv_import_job = None
+        self.inv_import_button.state(["!disabled"])
+        self.inv_import_cancel_button.state(["disabled"])
+        self.inv_import_status.config(text="Import failed.")
+        messagebox.showerror("Import Error", str(error))
+
+    def finish_inventory_import(self, inventory_import):
+        self.inv_import_job = None
+        self.inv_import_button.state(["!disabled"])
+        self.inv_import_cancel_button.state(["disabled"])
+        self.inv_import_progress["value"] = 1.0
+        try:
+            added = self.core.apply_import(inventory_import)
+        except ValueError as e:
+            # A VIN was added by hand while the feed was being validated.
+            self.inv_import_status.config(text="Import failed.")
+            messagebox.showerror("Import Error", str(e))
+            return
+        print("Inventory import added", len(added), "items. Total items now:", len(self.inventory))
+        self.schedule_db_flush()
+
+        # One display refresh and dropdown update for the whole batch.
+        if self.inv_search_filters is None:
+            self.refresh_inventory_display()
+        else:
+            self.search_inventory()
+        if added and hasattr(self, 'fin_vin_combo') and not self.fin_vin_var.get():
+            self.fin_vin_var.set(added[0].vin)
+        if added and hasattr(self, 'lease_vin_combo') and not self.lease_vin_var.get():
+            self.lease_vin_var.set(added[0].vin)
+
+        errors = inventory_import.errors
+        self.inv_import_status.config(text=f"Imported {len(added)}, rejected {len(errors)}.")
+        summary = f"Imported {len(added)} inventory items."
+        if errors:
+            details = "\n".join(f"Line {line_no}: {message}" for line_no, message in errors[:10])
+            more = f"\n...and {len(errors) - 10} more." if len(errors) > 10 else ""
+            summary += f"\n\nRejected {len(errors)} records:\n{details}{more}"
+        messagebox.showinfo("Inventory Import", summary)
+
+    def schedule_live_search(self, *args):
+        """Debounce edits to the search fields so a burst of typing runs one search."""
+        if not self.inv_live_search_var.get():
+            return
+        self.cancel_live_search()
+        self.inv_search_after_id = self.root.after(LIVE_SEARCH_DELAY_MS, self.run_live_search)
+
+    def cancel_live_search(self):
+        if self.inv_search_after_id is not None:
+            self.root.after_cancel(self.inv_search_after_id)
+            self.inv_search_after_id = None
+
+    def run_live_search(self):
+        self.inv_search_after_id = None
+        filters = self.current_search_filters()
+        # Typing that ends where it started (e.g. "A4" -> "A" -> "A4") needs no render.
+        if filters != self.inv_search_filters:
+            self.search_inventory()
+
+    def current_search_filters(self):
+        return (self.inv_search_make_var.get().strip().lower(),
+                self.inv_search_model_var.get().strip().lower(),
+                self.inv_search_type_var.get().strip().lower(),
+                self.inv_search_year_var.get().strip().lower())
+
     def search_inventory(self):
-        search_make = self.inv_search_make_var.get().strip().lower()
-        search_model = self.inv_search_model_var.get().strip().lower()
-        search_type = self.inv_search_type_var.get().strip().lower()
-        search_year = self.inv_search_year_var.get().strip().lower()
-        filtered = []
-        for item in self.inventory_items:
-            if search_make != "all" and search_make not in item['make'].lower():
-                continue
-            if search_model and search_model not in item['model'].lower():
-                continue
-            if search_type != "all" and search_type != item['type'].lower():
-                continue
-            if search_year and search_year not in item.get('year', '').lower():
-                continue
-            filtered.append(item)
-        self.inv_display_frame.destroy()
-        self.inv_display_frame = ttk.Frame(self.inventory_tab)
-        self.inv_display_frame.pack(fill="both", expand=True, padx=10, pady=5)
-        cols = 3
-        for i, item in enumerate(filtered):
-            fin_options = "\n".join(item.get("financing_options", [])) if item.get("financing_options") else "N/A"
-            lease_options = "\n".join(item.get("lease_options", [])) if item.get("lease_options") else "N/A"
-            box_text = f"{item['make']} {item['model']} ({item.get('year', 'N/A')})"
-            box = ttk.LabelFrame(self.inv_display_frame, text=box_text, relief="solid")
-            box.grid(row=i // cols, column=i % cols, padx=5, pady=5, sticky="nsew")
-            info = f"Type: {item['type']}\nVIN: {item['vin']}\nPrice: {item['price']}\n\nFinancing:\n{fin_options}\n\nLease:\n{lease_options}"
-            ttk.Label(box, text=info, wraplength=200).pack(padx=5, pady=5)
-            btn_frame = ttk.Frame(box)
-            btn_frame.pack(padx=5, pady=5)
-            ttk.Button(btn_frame, text="Add Financing", command=lambda vin=item['vin']: self.open_financing_options_for_item(vin))\
-                .grid(row=0, column=0, padx=5)
-            ttk.Button(btn_frame, text="Add Lease", command=lambda vin=item['vin']: self.open_lease_options_for_item(vin))\
-                .grid(row=0, column=1, padx=5)
-        for c in range(cols):
-            self.inv_display_frame.columnconfigure(c, weight=1)
+        self.cancel_live_search()
+        if self.inv_search_job is not None:
+            self.inv_search_job.cancel()   # its results would be stale
+            self.inv_search_job = None
+        self.inv_search_filters = self.current_search_filters()
+        if len(self.inventory) < BACKGROUND_SEARCH_MIN_ITEMS:
+            self.show_search_results(self.core.search(*self.inv_search_filters))
+            return
+        self.inv_search_job = self.jobs.run_in_thread(
+            lambda job, filters: self.core.search(*filters), self.inv_search_filters,
+            on_done=self.show_search_results)
+
+    def show_search_results(self, filtered):
+        self.inv_search_job = None
+        self.inv_grid.set_items(filtered, reset_scroll=True)
 
     def reset_inventory_search(self):
         self.inv_search_make_var.set("All")
         self.inv_search_model_var.set("")
         self.inv_search_type_var.set("All")
         self.inv_search_year_var.set("")
+        self.cancel_live_search()
+        if self.inv_search_job is not None:
+            self.inv_search_job.cancel()
+            self.inv_search_job = None
+        self.inv_search_filters = None
         self.refresh_inventory_display()
 
     def build_manager_financing_view(self):
@@ -408,9 +761,10 @@ class CarDealershipApp:
         top_frame.pack(fill="x", padx=10, pady=5)
         ttk.Label(top_frame, text="Select Inventory VIN for Financing:").pack(side="left", padx=5)
         self.fin_vin_var = tk.StringVar()
-        vin_opts = [item['vin'] for item in self.inventory_items]
-        self.fin_vin_combo = ttk.Combobox(top_frame, textvariable=self.fin_vin_var, values=vin_opts, state="readonly")
-        if vin_opts:
+        self.fin_vin_combo = ttk.Combobox(top_frame, textvariable=self.fin_vin_var, state="readonly",
+                                          postcommand=lambda: self.sync_vin_combo(self.fin_vin_combo))
+        self.sync_vin_combo(self.fin_vin_combo)
+        if self.inventory.vins:
             self.fin_vin_combo.current(0)
         self.fin_vin_combo.pack(side="left", padx=5)
         ttk.Button(top_frame, text="Set Financing Options", command=self.open_manager_financing_popup)\
@@ -431,13 +785,19 @@ class CarDealershipApp:
         lease_top_frame.pack(fill="x", padx=10, pady=5)
         ttk.Label(lease_top_frame, text="Select Inventory VIN for Lease:").pack(side="left", padx=5)
         self.lease_vin_var = tk.StringVar()
-        vin_opts = [item['vin'] for item in self.inventory_items]
-        self.lease_vin_combo = ttk.Combobox(lease_top_frame, textvariable=self.lease_vin_var, values=vin_opts, state="readonly")
-        if vin_opts:
+        self.lease_vin_combo = ttk.Combobox(lease_top_frame, textvariable=self.lease_vin_var, state="readonly",
+                                            postcommand=lambda: self.sync_vin_combo(self.lease_vin_combo))
+        self.sync_vin_combo(self.lease_vin_combo)
+        if self.inventory.vins:
             self.lease_vin_combo.current(0)
         self.lease_vin_combo.pack(side="left", padx=5)
         ttk.Button(lease_top_frame, text="Set Lease Options", command=self.open_manager_lease_popup)\
             .pack(side="left", padx=5)
+        ttk.Label(lease_top_frame, text="New APR (%):").pack(side="left", padx=(20, 5))
+        self.reprice_apr_var = tk.StringVar()
+        ttk.Entry(lease_top_frame, textvariable=self.reprice_apr_var, width=6).pack(side="left")
+        ttk.Button(lease_top_frame, text="Reprice All Leases", command=self.reprice_all_leases)\
+            .pack(side="left", padx=5)
 
         # Frame for lease options tree
         self.manager_lease_tree = ttk.Treeview(self.manager_financing_tab, columns=("VIN", "Lease"), show="headings")
@@ -448,6 +808,241 @@ class CarDealershipApp:
         self.refresh_manager_financing_tree()
         self.refresh_manager_lease_tree()
 
+        # Quote tools share one sub-notebook below the saved quote trees
+        self.manager_tools = ttk.Notebook(self.manager_financing_tab)
+        self.manager_tools.pack(fill="both", expand=True, padx=10, pady=5)
+        self.build_quote_matrix_view()
+        self.build_schedule_view()
+
+        self.quote_cache_label = ttk.Label(self.manager_financing_tab, text="")
+        self.quote_cache_label.pack(anchor="w", padx=10, pady=(0, 5))
+        self.refresh_quote_cache_stats()
+
+    def refresh_quote_cache_stats(self):
+        stats = cache_stats()
+        self.quote_cache_label.config(text="Quote cache: " + ", ".join(
+            f"{name} {s['hits']} hits / {s['misses']} misses ({s['hit_rate']:.0%})" for name, s in stats.items()))
+
+    def build_quote_matrix_view(self):
+        """Payment grid across every financing term, a range of APRs and down payments."""
+        matrix_frame = ttk.Frame(self.manager_tools)
+        self.manager_tools.add(matrix_frame, text="Financing Quote Matrix")
+        controls = ttk.Frame(matrix_frame)
+        controls.pack(fill="x", padx=5, pady=5)
+
+        ttk.Label(controls, text="Vehicle:").pack(side="left", padx=5)
+        self.matrix_vin_var = tk.StringVar(value=MATRIX_ALL_VEHICLES)
+        self.matrix_vin_combo = ttk.Combobox(controls, textvariable=self.matrix_vin_var, state="readonly",
+                                             postcommand=self.sync_matrix_vin_combo)
+        self.matrix_vin_combo.pack(side="left", padx=5)
+        ttk.Label(controls, text="Down Payments:").pack(side="left", padx=5)
+        self.matrix_down_var = tk.StringVar(value="0, 2000, 5000")
+        ttk.Entry(controls, textvariable=self.matrix_down_var, width=16).pack(side="left", padx=5)
+        ttk.Label(controls, text="APR % from:").pack(side="left", padx=5)
+        self.matrix_apr_from_var = tk.StringVar(value="2.9")
+        ttk.Entry(controls, textvariable=self.matrix_apr_from_var, width=5).pack(side="left")
+        ttk.Label(controls, text="to:").pack(side="left", padx=5)
+        self.matrix_apr_to_var = tk.StringVar(value="7.9")
+        ttk.Entry(controls, textvariable=self.matrix_apr_to_var, width=5).pack(side="left")
+        ttk.Label(controls, text="step:").pack(side="left", padx=5)
+        self.matrix_apr_step_var = tk.StringVar(value="1.0")
+        ttk.Entry(controls, textvariable=self.matrix_apr_step_var, width=5).pack(side="left")
+        ttk.Button(controls, text="Build Matrix", command=self.build_quote_matrix).pack(side="left", padx=5)
+        self.matrix_status = ttk.Label(controls, text="")
+        self.matrix_status.pack(side="left", padx=5)
+
+        self.quote_table = None
+        self.matrix_sort = None   # (column, descending) of the last heading click
+        columns = list(QuoteTable.KEY_COLUMNS) + [f"{term} mo" for term in FINANCING_TERMS]
+        self.matrix_tree = ttk.Treeview(matrix_frame, columns=columns, show="headings", height=8)
+        for column in columns:
+            self.matrix_tree.heading(column, text=column, command=lambda c=column: self.sort_quote_matrix(c))
+            self.matrix_tree.column(column, width=90 if column != "VIN" else 150, anchor="e")
+        self.matrix_tree.pack(fill="both", expand=True, padx=5, pady=5)
+
+    def build_schedule_view(self):
+        """Month-by-month amortization for one VIN, paged lazily from a generator."""
+        schedule_frame = ttk.Frame(self.manager_tools)
+        self.manager_tools.add(schedule_frame, text="Amortization Schedule")
+        controls = ttk.Frame(schedule_frame)
+        controls.pack(fill="x", padx=5, pady=5)
+
+        ttk.Label(controls, text="VIN:").pack(side="left", padx=5)
+        self.schedule_vin_var = tk.StringVar()
+        self.schedule_vin_combo = ttk.Combobox(controls, textvariable=self.schedule_vin_var, state="readonly",
+                                               postcommand=lambda: self.sync_vin_combo(self.schedule_vin_combo))
+        self.schedule_vin_combo.pack(side="left", padx=5)
+        ttk.Label(controls, text="Money Down:").pack(side="left", padx=5)
+        self.schedule_down_var = tk.StringVar(value="0")
+        ttk.Entry(controls, textvariable=self.schedule_down_var, width=10).pack(side="left")
+        ttk.Label(controls, text="Months:").pack(side="left", padx=5)
+        self.schedule_months_var = tk.StringVar(value=str(FINANCING_TERMS[0]))
+        ttk.Combobox(controls, textvariable=self.schedule_months_var, values=[str(m) for m in FINANCING_TERMS],
+                     state="readonly", width=5).pack(side="left")
+        ttk.Label(controls, text="APR (%):").pack(side="left", padx=5)
+        self.schedule_apr_var = tk.StringVar(value="3.5")
+        ttk.Entry(controls, textvariable=self.schedule_apr_var, width=6).pack(side="left")
+        ttk.Button(controls, text="Show Schedule", command=self.show_schedule).pack(side="left", padx=5)
+        self.schedule_more_button = ttk.Button(controls, text="Load More", command=self.load_schedule_page)
+        self.schedule_more_button.pack(side="left", padx=5)
+        self.schedule_more_button.state(["disabled"])
+        ttk.Button(controls, text="Export CSV...", command=lambda: self.export_schedules(all_vehicles=False))\
+            .pack(side="left", padx=5)
+        ttk.Button(controls, text="Export All Vehicles...", command=lambda: self.export_schedules(all_vehicles=True))\
+            .pack(side="left", padx=5)
+
+        self.schedule_rows = None   # live amortization_schedule generator for the shown VIN
+        columns = ("Month", "Payment", "Principal", "Interest", "Balance")
+        self.schedule_tree = ttk.Treeview(schedule_frame, columns=columns, show="headings", height=8)
+        for column in columns:
+            self.schedule_tree.heading(column, text=column)
+            self.schedule_tree.column(column, width=110, anchor="e")
+        self.schedule_tree.pack(fill="both", expand=True, padx=5, pady=5)
+
+    def read_schedule_terms(self):
+        """Return (money down, months, apr) from the schedule controls, or None after an error."""
+        try:
+            money_down = float(self.schedule_down_var.get().strip() or 0)
+            months = int(self.schedule_months_var.get())
+            apr = float(self.schedule_apr_var.get().strip())
+        except ValueError as e:
+            messagebox.showerror("Input Error", f"Invalid input: {e}")
+            return None
+        return money_down, months, apr
+
+    def show_schedule(self):
+        vehicle = self.inventory.get(self.schedule_vin_var.get())
+        terms = self.read_schedule_terms()
+        if vehicle is None or terms is None:
+            if vehicle is None:
+                messagebox.showerror("Input Error", "Please select an inventory item (by VIN).")
+            return
+        money_down, months, apr = terms
+        principal = vehicle.price - money_down
+        if principal <= 0:
+            messagebox.showerror("Input Error", "Money down must be less than the price.")
+            return
+        self.schedule_tree.delete(*self.schedule_tree.get_children())
+        self.schedule_rows = amortization_schedule(principal, months, apr)
+        self.load_schedule_page()
+
+    def load_schedule_page(self):
+        """Pull the next page of rows from the schedule generator into the tree."""
+        if self.schedule_rows is None:
+            return
+        page = list(itertools.islice(self.schedule_rows, SCHEDULE_PAGE_SIZE))
+        for month, payment, principal_paid, interest, balance in page:
+            self.schedule_tree.insert("", "end", values=(month, f"${payment:,.2f}", f"${principal_paid:,.2f}",
+                                                         f"${interest:,.2f}", f"${balance:,.2f}"))
+        if len(page) < SCHEDULE_PAGE_SIZE:
+            self.schedule_rows = None
+            self.schedule_more_button.state(["disabled"])
+        else:
+            self.schedule_more_button.state(["!disabled"])
+
+    def export_schedules(self, all_vehicles):
+        """Stream schedules to CSV row by row, for the selected VIN or the whole lot."""
+        if all_vehicles:
+            vehicles = self.inventory
+        else:
+            vehicle = self.inventory.get(self.schedule_vin_var.get())
+            if vehicle is None:
+                messagebox.showerror("Input Error", "Please select an inventory item (by VIN).")
+                return
+            vehicles = [vehicle]
+        terms = self.read_schedule_terms()
+        if terms is None:
+            return
+        path = filedialog.asksaveasfilename(title="Export Amortization Schedule", defaultextension=".csv",
+                                            filetypes=[("CSV files", "*.csv")])
+        if not path:
+            return
+        # CPU-bound formatting, so it runs in a worker process rather than a thread.
+        self.jobs.run_in_process(
+            export_schedules_csv, path, list(vehicles), *terms,
+            on_done=lambda count: messagebox.showinfo("Export Complete", f"Wrote {count} schedule rows to {path}."),
+            on_error=lambda e: messagebox.showerror("Export Error", f"Could not export schedules: {e}"))
+
+    def sync_matrix_vin_combo(self):
+        self.matrix_vin_combo['values'] = [MATRIX_ALL_VEHICLES] + self.inventory.vins
+
+    def build_quote_matrix(self):
+        try:
+            down_payments = [float(x) for x in self.matrix_down_var.get().split(",") if x.strip()] or [0.0]
+            apr_from = float(self.matrix_apr_from_var.get())
+            apr_to = float(self.matrix_apr_to_var.get())
+            apr_step = float(self.matrix_apr_step_var.get())
+        except ValueError as e:
+            messagebox.showerror("Input Error", f"Invalid input: {e}")
+            return
+        if apr_step <= 0 or apr_to < apr_from:
+            messagebox.showerror("Input Error", "APR range must run from low to high with a positive step.")
+            return
+        aprs = [round(apr_from + i * apr_step, 4) for i in range(int((apr_to - apr_from) / apr_step + 1e-9) + 1)]
+
+        selected = self.matrix_vin_var.get()
+        if selected == MATRIX_ALL_VEHICLES:
+            vehicles = list(self.inventory)
+        else:
+            vehicles = [self.inventory.get(selected)] if selected in self.inventory else []
+        if not vehicles:
+            messagebox.showerror("Input Error", "There are no vehicles to quote.")
+            return
+
+        self.matrix_status.config(text="Building...")
+        self.jobs.run_in_thread(
+            lambda job: QuoteTable([v.vin for v in vehicles], [v.price for v in vehicles],
+                                   down_payments, FINANCING_TERMS, aprs),
+            on_done=self.show_new_quote_matrix,
+            on_error=lambda e: messagebox.showerror("Input Error", f"Could not build matrix: {e}"))
+
+    def show_new_quote_matrix(self, quote_table):
+        self.quote_table = quote_table
+        self.matrix_sort = None
+        self.show_quote_matrix()
+
+    def sort_quote_matrix(self, column):
+        """Sort the whole matrix by a heading; clicking the same heading again reverses it."""
+        if self.quote_table is None:
+            return
+        descending = self.matrix_sort == (column, False)
+        self.matrix_sort = (column, descending)
+        self.quote_table.sort(column, descending)
+        self.show_quote_matrix()
+
+    def show_quote_matrix(self):
+        self.matrix_tree.delete(*self.matrix_tree.get_children())
+        for vin, price, down, apr, *payments in self.quote_table.rows(MATRIX_DISPLAY_LIMIT):
+            payment_text = ["-" if math.isnan(p) else f"${p:,.2f}" for p in payments]
+            self.matrix_tree.insert("", "end", values=(vin, f"${price:,.2f}", f"${down:,.2f}", f"{apr:.2f}%",
+                                                       *payment_text))
+        shown = min(len(self.quote_table), MATRIX_DISPLAY_LIMIT)
+        self.matrix_status.config(text=f"Showing {shown} of {len(self.quote_table)} quote rows")
+
+    def sync_vin_combo(self, combo):
+        """Load the store's VIN list into a dropdown if it grew since the last sync."""
+        if self.vin_combo_sizes.get(str(combo)) != len(self.inventory.vins):
+            combo['values'] = self.inventory.vins
+            self.vin_combo_sizes[str(combo)] = len(self.inventory.vins)
+
+    def reprice_all_leases(self):
+        """Re-quote every saved lease in the inventory at a new APR in one vectorized batch."""
+        try:
+            apr = float(self.reprice_apr_var.get().strip())
+        except ValueError:
+            messagebox.showerror("Input Error", "Please enter the new APR as a number.")
+            return
+        try:
+            updated, total = self.core.reprice_leases(apr)
+        except ValueError as e:
+            messagebox.showerror("Input Error", str(e))
+            return
+        self.schedule_db_flush()
+        self.refresh_manager_lease_tree()
+        if hasattr(self, 'inv_grid'):
+            self.inv_grid.render()
+        messagebox.showinfo("Leases Repriced", f"Repriced {len(updated)} of {total} lease quotes at {apr}% APR.")
+
     def open_manager_financing_popup(self):
         selected_vin = self.fin_vin_var.get().strip()
         if not selected_vin:
@@ -469,7 +1064,9 @@ class CarDealershipApp:
         self.open_lease_options_popup(vin)
 
     def open_financing_options_popup(self, selected_vin):
-        popup = tk.Toplevel(self.root)
+        self.dialogs.open("financing", self.build_financing_options_popup, selected_vin)
+
+    def build_financing_options_popup(self, popup):
         popup.title("Set Financing Options")
 
         ttk.Label(popup, text="Lowest Price:").grid(row=0, column=0, padx=5, pady=5, sticky="e")
@@ -482,51 +1079,55 @@ class CarDealershipApp:
 
         ttk.Label(popup, text="Financing Months:").grid(row=2, column=0, padx=5, pady=5, sticky="e")
         # For financing options, months range 60-144 (increments of 12)
-        fin_months_opts = [str(m) for m in range(60, 145, 12)]
+        fin_months_opts = [str(m) for m in FINANCING_TERMS]
         fin_months_var = tk.StringVar()
         ttk.Combobox(popup, textvariable=fin_months_var, values=fin_months_opts, state="readonly")\
             .grid(row=2, column=1, padx=5, pady=5)
-        fin_months_var.set(fin_months_opts[0])
 
         ttk.Label(popup, text="APR Rate (%):").grid(row=3, column=0, padx=5, pady=5, sticky="e")
-        apr_var = tk.StringVar(value="3.5")
+        apr_var = tk.StringVar()
         ttk.Entry(popup, textvariable=apr_var).grid(row=3, column=1, padx=5, pady=5)
 
-        result_label = ttk.Label(popup, text="Monthly Payment: ")
+        result_label = ttk.Label(popup)
         result_label.grid(row=5, column=0, columnspan=2, padx=5, pady=5)
+        target = {}   # the VIN this use of the dialog quotes for
+
+        def reset(selected_vin):
+            target["vin"] = selected_vin
+            lowest_price_var.set("")
+            money_down_var.set("")
+            fin_months_var.set(fin_months_opts[0])
+            apr_var.set("3.5")
+            result_label.config(text="Monthly Payment: ")
 
         def calculate_financing():
+            selected_vin = target["vin"]
             try:
                 lowest_price = float(lowest_price_var.get().strip())
                 money_down = float(money_down_var.get().strip())
                 months = int(fin_months_var.get().strip())
                 apr = float(apr_var.get().strip())
-                principal = lowest_price - money_down
-                if principal <= 0:
-                    messagebox.showerror("Input Error", "Money down must be less than the lowest price.")
-                    return
-                monthly_rate = apr / 100 / 12
-                if monthly_rate == 0:
-                    payment = principal / months
-                else:
-                    payment = (principal * monthly_rate) / (1 - (1 + monthly_rate) ** -months)
-                result = f"${payment:.2f}/month for {months} months at {apr}% APR"
-                result_label.config(text=f"Monthly Payment: {result}")
-                for item in self.inventory_items:
-                    if item['vin'] == selected_vin:
-                        item.setdefault('financing_options', []).append(result)
-                        break
-                self.refresh_inventory_display()
-                self.refresh_manager_financing_tree()
-                popup.destroy()
+                quote = self.core.quote_financing(selected_vin, lowest_price, money_down, months, apr)
+                result_label.config(text=f"Monthly Payment: {quote}")
+                if hasattr(self, 'manager_financing_tree'):
+                    self.update_manager_tree_row(self.manager_financing_tree, selected_vin,
+                                                 self.inventory.get(selected_vin).financing_options)
+                    self.refresh_quote_cache_stats()
+                self.schedule_db_flush()
+                if hasattr(self, 'inv_grid'):
+                    self.inv_grid.refresh_item(selected_vin)
+                popup.withdraw()
             except Exception as e:
                 messagebox.showerror("Input Error", f"Invalid input: {e}")
 
         ttk.Button(popup, text="Calculate & Save Financing", command=calculate_financing)\
             .grid(row=4, column=0, columnspan=2, pady=10)
+        return reset
 
     def open_lease_options_popup(self, selected_vin):
-        popup = tk.Toplevel(self.root)
+        self.dialogs.open("lease", self.build_lease_options_popup, selected_vin)
+
+    def build_lease_options_popup(self, popup):
         popup.title("Set Lease Options")
 
         ttk.Label(popup, text="Lowest Price:").grid(row=0, column=0, padx=5, pady=5, sticky="e")
@@ -539,61 +1140,92 @@ class CarDealershipApp:
 
         ttk.Label(popup, text="Lease Months:").grid(row=2, column=0, padx=5, pady=5, sticky="e")
         # For lease options, months range 12-36 (increments of 1)
-        lease_months_opts = [str(m) for m in range(12, 37)]
+        lease_months_opts = [str(m) for m in LEASE_TERMS]
         lease_months_var = tk.StringVar()
         ttk.Combobox(popup, textvariable=lease_months_var, values=lease_months_opts, state="readonly")\
             .grid(row=2, column=1, padx=5, pady=5)
-        lease_months_var.set(lease_months_opts[0])
 
         ttk.Label(popup, text="APR Rate (%):").grid(row=3, column=0, padx=5, pady=5, sticky="e")
-        apr_var = tk.StringVar(value="3.5")
+        apr_var = tk.StringVar()
         ttk.Entry(popup, textvariable=apr_var).grid(row=3, column=1, padx=5, pady=5)
 
-        result_label = ttk.Label(popup, text="Monthly Lease Payment: ")
-        result_label.grid(row=5, column=0, columnspan=2, padx=5, pady=5)
+        ttk.Label(popup, text="Residual (%):").grid(row=4, column=0, padx=5, pady=5, sticky="e")
+        residual_var = tk.StringVar()
+        ttk.Entry(popup, textvariable=residual_var).grid(row=4, column=1, padx=5, pady=5)
+
+        ttk.Label(popup, text="Acquisition Fee:").grid(row=5, column=0, padx=5, pady=5, sticky="e")
+        acquisition_fee_var = tk.StringVar()
+        ttk.Entry(popup, textvariable=acquisition_fee_var).grid(row=5, column=1, padx=5, pady=5)
+
+        ttk.Label(popup, text="Tax Rate (%):").grid(row=6, column=0, padx=5, pady=5, sticky="e")
+        tax_rate_var = tk.StringVar()
+        ttk.Entry(popup, textvariable=tax_rate_var).grid(row=6, column=1, padx=5, pady=5)
+
+        result_label = ttk.Label(popup)
+        result_label.grid(row=8, column=0, columnspan=2, padx=5, pady=5)
+        target = {}   # the VIN this use of the dialog quotes for
+
+        def reset(selected_vin):
+            target["vin"] = selected_vin
+            lowest_price_var.set("")
+            money_down_var.set("")
+            lease_months_var.set(lease_months_opts[0])
+            apr_var.set("3.5")
+            residual_var.set(str(DEFAULT_RESIDUAL_PCT))
+            acquisition_fee_var.set(str(DEFAULT_ACQUISITION_FEE))
+            tax_rate_var.set(str(DEFAULT_TAX_RATE))
+            result_label.config(text="Monthly Lease Payment: ")
 
         def calculate_lease():
+            selected_vin = target["vin"]
             try:
                 lowest_price = float(lowest_price_var.get().strip())
                 money_down = float(money_down_var.get().strip())
                 months = int(lease_months_var.get().strip())
                 apr = float(apr_var.get().strip())
-                principal = lowest_price - money_down
-                if principal <= 0:
-                    messagebox.showerror("Input Error", "Money down must be less than the lowest price.")
-                    return
-                # Simplified lease calculation: (Principal) divided by lease term.
-                lease_payment = principal / months
-                result = f"${lease_payment:.2f}/month for {months} months at {apr}% APR (Lease)"
-                result_label.config(text=f"Monthly Lease Payment: {result}")
-                for item in self.inventory_items:
-                    if item['vin'] == selected_vin:
-                        item.setdefault('lease_options', []).append(result)
-                        break
-                self.refresh_inventory_display()
-                self.refresh_manager_lease_tree()
-                popup.destroy()
+                residual_pct = float(residual_var.get().strip())
+                acquisition_fee = float(acquisition_fee_var.get().strip() or 0)
+                tax_rate = float(tax_rate_var.get().strip() or 0)
+                # Residual/money-factor lease pricing, including acquisition fee and tax.
+                quote = self.core.quote_lease(selected_vin, lowest_price, money_down, months, apr,
+                                              residual_pct, acquisition_fee, tax_rate)
+                result_label.config(text=f"Monthly Lease Payment: {quote}")
+                if hasattr(self, 'manager_lease_tree'):
+                    self.update_manager_tree_row(self.manager_lease_tree, selected_vin,
+                                                 self.inventory.get(selected_vin).lease_options)
+                    self.refresh_quote_cache_stats()
+                self.schedule_db_flush()
+                if hasattr(self, 'inv_grid'):
+                    self.inv_grid.refresh_item(selected_vin)
+                popup.withdraw()
             except Exception as e:
                 messagebox.showerror("Input Error", f"Invalid input: {e}")
 
         ttk.Button(popup, text="Calculate & Save Lease", command=calculate_lease)\
-            .grid(row=4, column=0, columnspan=2, pady=10)
+            .grid(row=7, column=0, columnspan=2, pady=10)
+        return reset
+
+    def update_manager_tree_row(self, tree, vin, options):
+        """Insert or update the single row for vin in a manager quote tree."""
+        values = (vin, "\n".join(str(quote) for quote in options))
+        if tree.exists(vin):
+            tree.item(vin, values=values)
+        else:
+            tree.insert("", "end", iid=vin, values=values)
 
     def refresh_manager_financing_tree(self):
         for child in self.manager_financing_tree.get_children():
             self.manager_financing_tree.delete(child)
-        for item in self.inventory_items:
-            if item.get('financing_options'):
-                fin_options = "\n".join(item['financing_options'])
-                self.manager_financing_tree.insert("", "end", values=(item['vin'], fin_options))
+        for vehicle in self.inventory:
+            if vehicle.financing_options:
+                self.update_manager_tree_row(self.manager_financing_tree, vehicle.vin, vehicle.financing_options)
 
     def refresh_manager_lease_tree(self):
         for child in self.manager_lease_tree.get_children():
             self.manager_lease_tree.delete(child)
-        for item in self.inventory_items:
-            if item.get('lease_options'):
-                lease_options = "\n".join(item['lease_options'])
-                self.manager_lease_tree.insert("", "end", values=(item['vin'], lease_options))
+        for vehicle in self.inventory:
+            if vehicle.lease_options:
+                self.update_manager_tree_row(self.manager_lease_tree, vehicle.vin, vehicle.lease_options)
 
 
 if __name__ == "__main__":
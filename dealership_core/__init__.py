@@ -0,0 +1,17 @@
+"""Headless dealership engine: inventory, quoting and scheduling without Tk.
+
+DealershipCore is the entry point; the modules below it can also be used
+on their own. The Django-backed persistence in dealership_db is optional
+and only imported by callers that want it.
+"""
+from .appointments import (SALES_SHIFTS, SALESMEN, SERVICE_BAYS, SERVICE_JOB_HOURS, AppointmentBook, SalesAssigner,
+                           ServiceCapacity, SlotConflictError)
+from .engine import DealershipCore
+from .inventory_import import InventoryImport
+from .inventory_store import DuplicateVinError, FinancingQuote, InventoryStore, LeaseQuote, Vehicle
+
+__all__ = [
+    "AppointmentBook", "DealershipCore", "DuplicateVinError", "FinancingQuote", "InventoryImport",
+    "InventoryStore", "LeaseQuote", "SALES_SHIFTS", "SALESMEN", "SERVICE_BAYS", "SERVICE_JOB_HOURS",
+    "SalesAssigner", "ServiceCapacity", "SlotConflictError", "Vehicle",
+]
@@ -0,0 +1,56 @@
+"""Batch jobs against the dealership database, for servers without a display.
+
+    python -m dealership_core reprice-leases 4.9
+    python -m dealership_core import feed.csv
+    python -m dealership_core stats
+"""
+import argparse
+import time
+
+from .dealership_db import DealershipDatabase
+from .engine import DealershipCore
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m dealership_core", description=__doc__.splitlines()[0])
+    commands = parser.add_subparsers(dest="command", required=True)
+    reprice = commands.add_parser("reprice-leases", help="re-quote every saved lease at a new APR")
+    reprice.add_argument("apr", type=float)
+    feed = commands.add_parser("import", help="import a CSV or JSONL inventory feed")
+    feed.add_argument("path")
+    commands.add_parser("stats", help="count saved inventory, quotes and appointments")
+    args = parser.parse_args(argv)
+
+    started = time.perf_counter()
+    core = DealershipCore(DealershipDatabase())
+    core.load()
+    print(f"Loaded {len(core.inventory)} vehicles in {time.perf_counter() - started:.2f}s")
+
+    if args.command == "reprice-leases":
+        try:
+            updated, total = core.reprice_leases(args.apr)
+        except ValueError as e:
+            parser.exit(1, f"{e}\n")
+        print(f"Repriced {len(updated)} of {total} lease quotes at {args.apr}% APR.")
+    elif args.command == "import":
+        try:
+            added, errors = core.import_inventory(args.path)
+        except (OSError, ValueError) as e:
+            parser.exit(1, f"Could not import {args.path}: {e}\n")
+        print(f"Imported {len(added)} inventory items, rejected {len(errors)}.")
+        for line_no, message in errors:
+            print(f"Line {line_no}: {message}")
+    else:
+        financing = sum(len(vehicle.financing_options) for vehicle in core.inventory)
+        leases = sum(len(vehicle.lease_options) for vehicle in core.inventory)
+        print(f"Financing quotes: {financing}, lease quotes: {leases}")
+        print(f"Service appointments: {len(core.service_appointments)}, "
+              f"sales appointments: {len(core.sales_appointments)}")
+    skipped = core.flush()
+    if skipped:
+        print(f"Not saved, VIN already in the database: {', '.join(skipped)}")
+    print(f"Done in {time.perf_counter() - started:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,265 @@
+import heapq
+from collections import defaultdict
+from datetime import datetime, timedelta
+
+# Bookable hours, matching the scheduling grids' 08:00-18:00 rows
+BUSINESS_HOURS = list(range(8, 19))
+SERVICE_BAYS = ["Bay 1", "Bay 2", "Bay 3"]
+# Lengths, in hours, a service job can be booked for
+SERVICE_JOB_HOURS = [1, 2, 3, 4]
+SALESMEN = ["Chris", "Anthony", "Tyler", "Zach"]
+# Salesman -> (first hour, end hour) of their shift; the end hour is not bookable
+SALES_SHIFTS = {name: (8, 19) for name in SALESMEN}
+
+
+class SlotConflictError(ValueError):
+    """Raised when a booking would exceed a slot's capacity."""
+
+
+def slot_date(value):
+    """Normalize a datetime or date to the date used in slot keys."""
+    return value.date() if isinstance(value, datetime) else value
+
+
+def week_start(day):
+    """The Monday of the week containing day."""
+    day = slot_date(day)
+    return day - timedelta(days=day.weekday())
+
+
+def week_days(start):
+    """The seven dates of the week beginning at start."""
+    return [start + timedelta(days=offset) for offset in range(7)]
+
+
+class AppointmentBook:
+    """Appointments indexed by (date, hour, resource).
+
+    A resource is a service bay or a salesman. Each resource takes up to
+    ``capacity`` bookings per hourly slot and, if ``slot_capacity`` is set,
+    the slot as a whole takes at most that many across all resources.
+    Conflict checks are dict lookups, independent of how many appointments
+    are on the books, and a date index lets a calendar fetch one week
+    without scanning the rest.
+    """
+
+    def __init__(self, resources, capacity=1, slot_capacity=None, hours=BUSINESS_HOURS):
+        self.resources = list(resources)
+        self.capacity = capacity
+        self.slot_capacity = slot_capacity
+        self.hours = list(hours)
+        self.bookings = defaultdict(list)    # (date, hour, resource) -> appointments
+        self.slot_counts = defaultdict(int)  # (date, hour) -> bookings across resources
+        self.by_date = defaultdict(list)     # date -> appointments, in booking order
+
+    def slot_is_full(self, date, hour):
+        return self.slot_capacity is not None and self.slot_counts[(slot_date(date), hour)] >= self.slot_capacity
+
+    def is_free(self, date, hour, resource):
+        date = slot_date(date)
+        if self.slot_is_full(date, hour):
+            return False
+        return len(self.bookings.get((date, hour, resource), ())) < self.capacity
+
+    def is_free_for(self, date, hour, resource, duration=1):
+        """Whether resource is free for duration hours from hour, all within business hours."""
+        if hour + duration - 1 > self.hours[-1]:
+            return False
+        return all(self.is_free(date, h, resource) for h in range(hour, hour + duration))
+
+    def free_resources(self, date, hour, duration=1):
+        """Resources that can still take a booking in this slot, in roster order."""
+        return [resource for resource in self.resources if self.is_free_for(date, hour, resource, duration)]
+
+    def next_free_hour(self, date, hour):
+        """The first hour at or after hour on this date with a free resource, or None."""
+        for candidate in self.hours:
+            if candidate >= hour and self.free_resources(date, candidate):
+                return candidate
+        return None
+
+    def book(self, appointment, date, hour, resource=None, force=False, duration=1):
+        """Record an appointment and return the resource it was booked on.
+
+        The booking holds its resource for duration consecutive hours. Without
+        a resource the first free one is used (rerouting away from full ones).
+        SlotConflictError is raised if nothing fits, unless force is set, as
+        when loading bookings saved before conflict checks.
+        """
+        date = slot_date(date)
+        if resource is None:
+            free = self.free_resources(date, hour, duration)
+            if not free and not force:
+                raise SlotConflictError(f"No availability at {hour:02d}:00 on {date:%d-%b-%Y}.")
+            resource = free[0] if free else self.resources[0]
+        elif not force and not self.is_free_for(date, hour, resource, duration):
+            raise SlotConflictError(f"{resource} is already booked at {hour:02d}:00 on {date:%d-%b-%Y}.")
+        for h in range(hour, hour + duration):
+            self.bookings[(date, h, resource)].append(appointment)
+            self.slot_counts[(date, h)] += 1
+        self.by_date[date].append(appointment)
+        return resource
+
+    def appointments_at(self, date, hour):
+        date = slot_date(date)
+        return [appointment for resource in self.resources
+                for appointment in self.bookings.get((date, hour, resource), ())]
+
+    def appointments_on(self, date):
+        return self.by_date.get(slot_date(date), [])
+
+    def appointments_in_week(self, start):
+        """Yield the appointments of the week beginning at start, day by day."""
+        for day in week_days(start):
+            yield from self.appointments_on(day)
+
+
+class ServiceCapacity:
+    """Service bay occupancy as one bitmap per (date, bay), for open-slot search.
+
+    Bit i of a bay's mask is set while the bay is busy during book.hours[i].
+    A job of d hours can start at bit i when bits i..i+d-1 are clear, so
+    ANDing the free mask with itself shifted right 1..d-1 places marks every
+    possible start in a day at once. Bookings go through reserve(), which
+    keeps the AppointmentBook and the bitmaps in step.
+    """
+
+    def __init__(self, book):
+        self.book = book
+        self.hours = book.hours
+        self.hour_bits = {hour: i for i, hour in enumerate(self.hours)}
+        self.all_hours = (1 << len(self.hours)) - 1
+        self.masks = defaultdict(int)   # (date, bay) -> busy-hour bitmap
+
+    def occupy(self, date, hour, bay, duration=1):
+        run = ((1 << duration) - 1) << self.hour_bits[hour]
+        self.masks[(slot_date(date), bay)] |= run & self.all_hours
+
+    def reserve(self, appointment, date, hour, bay=None, duration=1, force=False):
+        """Book a job on bay, or the first bay free for its whole duration; returns the bay."""
+        bay = self.book.book(appointment, date, hour, bay, force=force, duration=duration)
+        self.occupy(date, hour, bay, duration)
+        return bay
+
+    def start_mask(self, date, bay, duration=1):
+        """Bitmap of the hours a job of duration hours could start on bay."""
+        free = ~self.masks.get((date, bay), 0) & self.all_hours
+        starts = free
+        for shift in range(1, duration):
+            starts &= free >> shift
+        return starts
+
+    def open_slots(self, start, count=10, duration=1, max_days=60):
+        """The earliest count (date, hour, bay) openings for a job, at or after start.
+
+        start is a date (the whole day counts) or a datetime (only whole hours
+        after it). Each opening hour is listed once, with the first bay free.
+        """
+        first_day = slot_date(start)
+        earliest = 0
+        if isinstance(start, datetime):
+            earliest = start.hour + (1 if start.minute or start.second or start.microsecond else 0)
+        slots = []
+        for offset in range(max_days):
+            day = first_day + timedelta(days=offset)
+            bay_starts = [(bay, self.start_mask(day, bay, duration)) for bay in self.book.resources]
+            any_start = 0
+            for bay, starts in bay_starts:
+                any_start |= starts
+            while any_start and len(slots) < count:
+                lowest = any_start & -any_start
+                any_start ^= lowest
+                hour = self.hours[lowest.bit_length() - 1]
+                if offset == 0 and hour < earliest:
+                    continue
+                slots.append((day, hour, next(bay for bay, starts in bay_starts if starts & lowest)))
+            if len(slots) >= count:
+                break
+        return slots
+
+
+class SalesAssigner:
+    """Assigns sales appointments to the least-loaded salesman free at that hour.
+
+    Each day keeps a heap of (load, roster position, salesman). A pick pops
+    until it reaches a salesman who is on shift and free in the slot and then
+    pushes the skipped entries back, so it costs O(log n) per salesman passed
+    over. Ties go to roster order. Entries whose load is out of date are
+    dropped as they surface. Every salesman given a shift must be one of
+    the book's resources; anyone else raises ValueError.
+    """
+
+    def __init__(self, book, shifts=None):
+        self.book = book
+        if shifts is None:
+            shifts = {name: (book.hours[0], book.hours[-1] + 1) for name in book.resources}
+        unknown = [name for name in shifts if name not in book.resources]
+        if unknown:
+            raise ValueError(f"Shifts given for salesmen not on the roster: {', '.join(map(str, unknown))}.")
+        self.shifts = dict(shifts)
+        self.roster = [name for name in book.resources if name in self.shifts]
+        self.positions = {name: position for position, name in enumerate(self.roster)}
+        self.loads = defaultdict(int)   # (date, salesman) -> appointments that day
+        self.heaps = {}                 # date -> [(load, position, salesman)], built on first use
+
+    def on_shift(self, salesman, hour):
+        start, end = self.shifts[salesman]
+        return start <= hour < end
+
+    def _heap(self, date):
+        heap = self.heaps.get(date)
+        if heap is None:
+            heap = [(self.loads[(date, name)], position, name) for position, name in enumerate(self.roster)]
+            heapq.heapify(heap)
+            self.heaps[date] = heap
+        return heap
+
+    def pick(self, date, hour):
+        """The least-loaded salesman on shift and free at this hour, or None."""
+        date = slot_date(date)
+        heap = self._heap(date)
+        skipped = []
+        found = None
+        while heap:
+            entry = heapq.heappop(heap)
+            load, position, name = entry
+            if load != self.loads[(date, name)]:
+                continue
+            skipped.append(entry)
+            if self.on_shift(name, hour) and self.book.is_free(date, hour, name):
+                found = name
+                break
+        for entry in skipped:
+            heapq.heappush(heap, entry)
+        return found
+
+    def record(self, date, salesman):
+        """Count a booking made for salesman on date, e.g. one loaded from the database."""
+        date = slot_date(date)
+        self.loads[(date, salesman)] += 1
+        if date in self.heaps and salesman in self.positions:
+            heapq.heappush(self.heaps[date], (self.loads[(date, salesman)], self.positions[salesman], salesman))
+
+    def assign(self, appointment, date, hour):
+        """Book appointment on the least-loaded free salesman and return their name.
+
+        Raises SlotConflictError when nobody on shift is free at that hour.
+        """
+        date = slot_date(date)
+        salesman = self.pick(date, hour)
+        if salesman is None:
+            raise SlotConflictError(f"No salesman on shift is free at {hour:02d}:00 on {date:%d-%b-%Y}.")
+        self.book.book(appointment, date, hour, salesman)
+        self.record(date, salesman)
+        return salesman
+
+    def utilization(self, start, days=7):
+        """Return {salesman: (booked hours, shift hours, percent)} for the days from start."""
+        start = slot_date(start)
+        report = {}
+        for name in self.roster:
+            first, end = self.shifts[name]
+            shift_hours = (end - first) * days
+            booked = sum(self.loads.get((start + timedelta(days=offset), name), 0) for offset in range(days))
+            report[name] = (booked, shift_hours, 100 * booked / shift_hours if shift_hours else 0.0)
+        return report
@@ -0,0 +1,223 @@
+import math
+import os
+import sys
+from datetime import datetime
+from decimal import Decimal
+
+from .inventory_store import FinancingQuote, LeaseQuote, Vehicle
+
+# The Django project (manage.py, settings and the inventory app) lives here.
+PROJECT_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "dealership_project")
+# Vehicles fetched per query when loading the inventory at startup.
+LOAD_PAGE_SIZE = 500
+# Rows per INSERT statement when flushing queued writes.
+WRITE_BATCH_SIZE = 500
+
+
+def setup_django():
+    """Configure Django for use outside manage.py. Raises ImportError without Django."""
+    import django
+    if PROJECT_DIR not in sys.path:
+        sys.path.insert(0, PROJECT_DIR)
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", "dealership_project.settings")
+    django.setup()
+
+
+def _decimal(value, max_digits, places, label):
+    """Round value for a DecimalField(max_digits, places); ValueError if the column cannot hold it.
+
+    SQLite stores out-of-range decimals anyway, and Django then fails to
+    read the row back, so everything is checked before it is queued.
+    """
+    if not math.isfinite(value):
+        raise ValueError(f"{label} must be a finite number, got {value}.")
+    number = Decimal(f"{value:.{places}f}")
+    if abs(number) >= 10 ** (max_digits - places):
+        raise ValueError(f"{label} {value:,.{places}f} is too large to save.")
+    return number
+
+
+def _money(value, label, max_digits=12):
+    return _decimal(value, max_digits, 2, label)
+
+
+def _rate(value, label):
+    return _decimal(value, 6, 3, label)
+
+
+def _vehicle_fields(vehicle):
+    return {"vin": vehicle.vin, "type": vehicle.type, "make": vehicle.make, "model": vehicle.model,
+            "year": vehicle.year, "price": _money(vehicle.price, "Price")}
+
+
+def _financing_fields(quote):
+    return {"payment": _money(quote.payment, "Payment", 10), "months": quote.months, "apr": _rate(quote.apr, "APR")}
+
+
+def _lease_fields(quote):
+    return {
+        "payment": _money(quote.payment, "Payment", 10), "months": quote.months, "apr": _rate(quote.apr, "APR"),
+        "price": None if quote.price is None else _money(quote.price, "Price"),
+        "money_down": _money(quote.money_down, "Money down"),
+        "residual_pct": None if quote.residual_pct is None else _rate(quote.residual_pct, "Residual"),
+        "acquisition_fee": _money(quote.acquisition_fee, "Acquisition fee", 10),
+        "tax_rate": _rate(quote.tax_rate, "Tax rate"),
+    }
+
+
+class DealershipDatabase:
+    """The desktop app's view of the Django project's SQLite database.
+
+    Inventory is read back page by page using keyset pagination on the
+    primary key. Writes are queued and written together by flush(), one
+    transaction with a bulk_create per model, so the UI never waits on a
+    commit per click. Queuing converts each record to its column values
+    and raises ValueError for one the database cannot hold, so a bad value
+    is reported where it was entered and never blocks later flushes.
+    """
+
+    def __init__(self, migrate=True):
+        setup_django()
+        if migrate:
+            from django.core.management import call_command
+            call_command("migrate", verbosity=0)
+        self.pending_vehicles = []       # Inventory column values
+        self.pending_financing = []      # (vin, FinancingQuote column values)
+        self.pending_leases = []         # (vin, LeaseQuote, column values)
+        self.pending_lease_updates = {}  # db_id -> column values of a repriced, already saved LeaseQuote
+        self.pending_appointments = []   # (kind, appointment dict)
+
+    def iter_inventory_pages(self, page_size=LOAD_PAGE_SIZE):
+        """Yield lists of Vehicles, with their saved quotes, in insertion order."""
+        from inventory import models
+        last_id = 0
+        while True:
+            rows = list(models.Inventory.objects.filter(id__gt=last_id).order_by("id")
+                        .values_list("id", "type", "make", "model", "year", "vin", "price")[:page_size])
+            if not rows:
+                return
+            last_id = rows[-1][0]
+            vehicles = {}
+            for row_id, type, make, model, year, vin, price in rows:
+                vehicles[row_id] = Vehicle(type, make, model, year, vin, float(price))
+            quotes = (models.FinancingQuote.objects.filter(inventory_id__in=list(vehicles)).order_by("id")
+                      .values_list("inventory_id", "payment", "months", "apr"))
+            for inventory_id, payment, months, apr in quotes:
+                vehicles[inventory_id].financing_options.append(FinancingQuote(float(payment), months, float(apr)))
+            quotes = (models.LeaseQuote.objects.filter(inventory_id__in=list(vehicles)).order_by("id")
+                      .values_list("inventory_id", "id", "payment", "months", "apr", "price", "money_down",
+                                   "residual_pct", "acquisition_fee", "tax_rate"))
+            for (inventory_id, quote_id, payment, months, apr, price, money_down,
+                 residual_pct, acquisition_fee, tax_rate) in quotes:
+                vehicles[inventory_id].lease_options.append(LeaseQuote(
+                    float(payment), months, float(apr),
+                    price=None if price is None else float(price), money_down=float(money_down),
+                    residual_pct=None if residual_pct is None else float(residual_pct),
+                    acquisition_fee=float(acquisition_fee), tax_rate=float(tax_rate), db_id=quote_id))
+            yield list(vehicles.values())
+
+    def iter_appointments(self, kind):
+        """Yield saved appointments of one kind as the dicts the scheduling tabs use."""
+        from inventory import models
+        rows = (models.Appointment.objects.filter(kind=kind).order_by("date", "hour", "id")
+                .values_list("customer", "vin", "bay", "salesman", "date", "hour", "duration"))
+        for customer, vin, bay, salesman, date, hour, duration in rows.iterator():
+            appointment = {"customer": customer, "date": datetime(date.year, date.month, date.day),
+                           "hour": f"{hour:02d}:00"}
+            if kind == "service":
+                appointment["vin"] = vin
+                appointment["bay"] = bay
+                appointment["duration"] = duration
+            else:
+                appointment["salesman"] = salesman
+            yield appointment
+
+    def saved_vins(self, vins):
+        """The subset of vins that already have a saved row."""
+        from inventory import models
+        vins = list(vins)
+        saved = set()
+        for start in range(0, len(vins), WRITE_BATCH_SIZE):
+            saved.update(models.Inventory.objects.filter(vin__in=vins[start:start + WRITE_BATCH_SIZE])
+                         .values_list("vin", flat=True))
+        return saved
+
+    def queue_vehicles(self, vehicles):
+        """Queue vehicles to save; if any cannot be saved, raise ValueError and queue none."""
+        self.pending_vehicles.extend([_vehicle_fields(vehicle) for vehicle in vehicles])
+
+    def queue_financing_quote(self, vin, quote):
+        self.pending_financing.append((vin, _financing_fields(quote)))
+
+    def queue_lease_quote(self, vin, quote):
+        self.pending_leases.append((vin, quote, _lease_fields(quote)))
+
+    def queue_lease_updates(self, quotes):
+        """Queue repriced quotes; ones not yet written are saved with their new price instead."""
+        rows = {id(quote): _lease_fields(quote) for quote in quotes}
+        for quote in quotes:
+            if quote.db_id is not None:
+                self.pending_lease_updates[quote.db_id] = rows[id(quote)]
+        self.pending_leases = [(vin, quote, rows.get(id(quote), fields)) for vin, quote, fields in self.pending_leases]
+
+    def queue_appointment(self, kind, appointment):
+        self.pending_appointments.append((kind, appointment))
+
+    def has_pending(self):
+        return bool(self.pending_vehicles or self.pending_financing or self.pending_leases
+                    or self.pending_lease_updates or self.pending_appointments)
+
+    def flush(self):
+        """Write every queued change in one transaction. Queues are kept on error.
+
+        Returns the VINs of queued vehicles that were not written because a
+        row with that VIN was already saved, e.g. by another process.
+        """
+        if not self.has_pending():
+            return []
+        from django.db import transaction
+        from inventory import models
+        from inventory.cache import bump_inventory_version
+        inventory_changed = bool(self.pending_vehicles or self.pending_financing or self.pending_leases
+                                 or self.pending_lease_updates)
+        with transaction.atomic():
+            # Leave out VINs that are already saved, and report them. ignore_conflicts is not used
+            # because SQLite's INSERT OR IGNORE would also drop rows failing a CHECK constraint.
+            saved_vins = self.saved_vins(row["vin"] for row in self.pending_vehicles)
+            skipped = [row["vin"] for row in self.pending_vehicles if row["vin"] in saved_vins]
+            models.Inventory.objects.bulk_create(
+                [models.Inventory(**row) for row in self.pending_vehicles if row["vin"] not in saved_vins],
+                batch_size=WRITE_BATCH_SIZE)
+
+            quote_vins = ({vin for vin, fields in self.pending_financing}
+                          | {vin for vin, quote, fields in self.pending_leases})
+            inventory_ids = dict(models.Inventory.objects.filter(vin__in=quote_vins).values_list("vin", "id"))
+            models.FinancingQuote.objects.bulk_create(
+                [models.FinancingQuote(inventory_id=inventory_ids[vin], **fields)
+                 for vin, fields in self.pending_financing if vin in inventory_ids],
+                batch_size=WRITE_BATCH_SIZE)
+            new_leases = [(quote, models.LeaseQuote(inventory_id=inventory_ids[vin], **fields))
+                          for vin, quote, fields in self.pending_leases if vin in inventory_ids]
+            models.LeaseQuote.objects.bulk_create([row for quote, row in new_leases], batch_size=WRITE_BATCH_SIZE)
+            models.LeaseQuote.objects.bulk_update(
+                [models.LeaseQuote(id=db_id, **fields) for db_id, fields in self.pending_lease_updates.items()],
+                ["payment", "apr"], batch_size=WRITE_BATCH_SIZE)
+
+            models.Appointment.objects.bulk_create(
+                [models.Appointment(kind=kind, customer=a["customer"], vin=a.get("vin", ""), bay=a.get("bay", ""),
+                                    salesman=a.get("salesman", ""), date=a["date"].date(),
+                                    hour=int(a["hour"][:2]), duration=a.get("duration", 1))
+                 for kind, a in self.pending_appointments],
+                batch_size=WRITE_BATCH_SIZE)
+        # Only record primary keys once the transaction has committed.
+        for quote, row in new_leases:
+            quote.db_id = row.pk
+        # Bulk writes send no model signals, so retire the web API's cached results here.
+        if inventory_changed:
+            bump_inventory_version()
+        self.pending_vehicles = []
+        self.pending_financing = []
+        self.pending_leases = []
+        self.pending_lease_updates = {}
+        self.pending_appointments = []
+        return skipped
@@ -0,0 +1,223 @@
+import math
+from datetime import datetime
+
+from .appointments import SALES_SHIFTS, SERVICE_BAYS, AppointmentBook, SalesAssigner, ServiceCapacity, slot_date
+from .inventory_import import InventoryImport
+from .inventory_store import DuplicateVinError, FinancingQuote, InventoryStore, LeaseQuote, Vehicle
+from .leasing import DEFAULT_ACQUISITION_FEE, DEFAULT_RESIDUAL_PCT, DEFAULT_TAX_RATE, reprice_lease_quotes
+from .quote_cache import financing_payment, lease_payment
+
+
+# Highest APR, in percent, a quote can be priced at.
+MAX_APR = 100.0
+
+
+def _check_finite(label, value):
+    if not math.isfinite(value):
+        raise ValueError(f"{label} must be a number, got {value}.")
+
+
+def _check_apr(apr):
+    if not math.isfinite(apr) or not 0 <= apr < MAX_APR:
+        raise ValueError(f"APR must be at least 0% and below {MAX_APR:g}%, got {apr}.")
+
+
+def _check_lease_terms(residual_pct, acquisition_fee, tax_rate):
+    if not math.isfinite(residual_pct) or not 0 <= residual_pct <= 100:
+        raise ValueError(f"Residual must be between 0% and 100%, got {residual_pct}.")
+    for label, value in (("Acquisition fee", acquisition_fee), ("Tax rate", tax_rate)):
+        if not math.isfinite(value) or value < 0:
+            raise ValueError(f"{label} must be zero or more, got {value}.")
+
+
+def _has_valid_lease_terms(quote):
+    try:
+        _check_lease_terms(quote.residual_pct, quote.acquisition_fee, quote.tax_rate)
+    except ValueError:
+        return False
+    return True
+
+
+def _appointment_datetime(day):
+    """Appointments carry their day as a midnight datetime, as the database loader returns them."""
+    day = slot_date(day)
+    return datetime(day.year, day.month, day.day)
+
+
+class DealershipCore:
+    """The dealership's inventory, quotes and appointments behind a plain Python API.
+
+    Nothing here touches Tk, so the same calls back the desktop app, batch
+    jobs and benchmarks. Every change is applied in memory and, when a
+    DealershipDatabase is attached, queued on it; flush() writes the queue.
+    Invalid input, including values too large to save, raises ValueError
+    (SlotConflictError for bookings) before anything changes.
+    """
+
+    def __init__(self, db=None, sales_shifts=SALES_SHIFTS):
+        self.db = db
+        self.inventory = InventoryStore()
+        # Until every saved page is loaded, new VINs are also checked against the database.
+        self.inventory_loaded = db is None
+        self.service_appointments = []
+        self.sales_appointments = []
+        self.service_book = AppointmentBook(SERVICE_BAYS)   # one car per bay per hour
+        self.service_capacity = ServiceCapacity(self.service_book)
+        # One customer per salesman per hour; the roster is whoever sales_shifts names, in its order.
+        self.sales_book = AppointmentBook(list(sales_shifts))
+        self.sales_assigner = SalesAssigner(self.sales_book, sales_shifts)
+
+    # Persistence
+
+    def load_appointments(self):
+        """Index every saved appointment. Bookings saved before conflict checks are kept as they are."""
+        for appointment in self.db.iter_appointments("service"):
+            appointment["bay"] = self.service_capacity.reserve(
+                appointment, appointment["date"], int(appointment["hour"][:2]), appointment["bay"] or None,
+                appointment["duration"], force=True)
+            self.service_appointments.append(appointment)
+        for appointment in self.db.iter_appointments("sales"):
+            self.sales_book.book(appointment, appointment["date"], int(appointment["hour"][:2]),
+                                 appointment["salesman"], force=True)
+            self.sales_assigner.record(appointment["date"], appointment["salesman"])
+            self.sales_appointments.append(appointment)
+
+    def load_inventory_pages(self):
+        """Add saved inventory one database page at a time, yielding the vehicles each page added."""
+        for page in self.db.iter_inventory_pages():
+            # Skip VINs added some other way before loading reached them.
+            added = [vehicle for vehicle in page if vehicle.vin not in self.inventory]
+            self.inventory.add_many(added)
+            yield added
+        self.inventory_loaded = True
+
+    def load(self):
+        """Load everything saved, for batch use where nothing is shown while loading."""
+        self.load_appointments()
+        for _ in self.load_inventory_pages():
+            pass
+
+    def flush(self):
+        """Write queued changes; returns the VINs of vehicles skipped as already saved."""
+        if self.db is None:
+            return []
+        return self.db.flush()
+
+    def _check_unsaved(self, vins):
+        """Reject VINs saved in inventory pages that have not been loaded yet."""
+        if self.inventory_loaded:
+            return
+        saved = self.db.saved_vins(vins)
+        if saved:
+            raise DuplicateVinError(f"VIN {', '.join(sorted(saved))} is already in inventory.")
+
+    # Inventory
+
+    def add_vehicle(self, type, make, model, year, vin, price):
+        """Parse and store one vehicle from text fields; duplicate VINs raise DuplicateVinError."""
+        vehicle = Vehicle.from_fields(type, make, model, year, vin, price)
+        self._check_unsaved([vehicle.vin])
+        self.inventory.add(vehicle)
+        if self.db is not None:
+            self.db.queue_vehicles([vehicle])
+        return vehicle
+
+    def open_import(self, path):
+        """Start a feed import; validate it with steps() or run(), then pass it to apply_import()."""
+        return InventoryImport(path, self.inventory)
+
+    def apply_import(self, inventory_import):
+        """Store an import's validated vehicles and return them."""
+        self._check_unsaved(vehicle.vin for vehicle in inventory_import.vehicles)
+        added = inventory_import.apply()
+        if self.db is not None:
+            self.db.queue_vehicles(added)
+        return added
+
+    def import_inventory(self, path):
+        """Validate and store a whole feed; returns (vehicles added, [(line, error)])."""
+        inventory_import = self.open_import(path)
+        inventory_import.run()
+        return self.apply_import(inventory_import), inventory_import.errors
+
+    def search(self, make="all", model="", item_type="all", year=""):
+        return self.inventory.search(make, model, item_type, year)
+
+    # Quotes
+
+    def _vehicle(self, vin):
+        vehicle = self.inventory.get(vin)
+        if vehicle is None:
+            raise ValueError(f"VIN {vin} is not in inventory.")
+        return vehicle
+
+    def quote_financing(self, vin, price, money_down, months, apr):
+        """Price a loan on price less money down and save it to the vehicle's financing options."""
+        _check_finite("Price", price)
+        _check_finite("Money down", money_down)
+        _check_apr(apr)
+        if price - money_down <= 0:
+            raise ValueError("Money down must be less than the lowest price.")
+        vehicle = self._vehicle(vin)
+        quote = FinancingQuote(financing_payment(price - money_down, months, apr), months, apr)
+        if self.db is not None:
+            self.db.queue_financing_quote(vin, quote)   # raises if the quote cannot be saved
+        vehicle.financing_options.append(quote)
+        return quote
+
+    def quote_lease(self, vin, price, money_down, months, apr, residual_pct=DEFAULT_RESIDUAL_PCT,
+                    acquisition_fee=DEFAULT_ACQUISITION_FEE, tax_rate=DEFAULT_TAX_RATE):
+        """Price a lease (residual, money factor, fee and tax) and save it to the vehicle's lease options."""
+        _check_finite("Price", price)
+        _check_finite("Money down", money_down)
+        _check_apr(apr)
+        _check_lease_terms(residual_pct, acquisition_fee, tax_rate)
+        if price - money_down <= 0:
+            raise ValueError("Money down must be less than the lowest price.")
+        vehicle = self._vehicle(vin)
+        payment = lease_payment(price, money_down, months, apr, residual_pct, acquisition_fee, tax_rate)
+        quote = LeaseQuote(payment, months, apr, price=price, money_down=money_down, residual_pct=residual_pct,
+                           acquisition_fee=acquisition_fee, tax_rate=tax_rate)
+        if self.db is not None:
+            self.db.queue_lease_quote(vin, quote)   # raises if the quote cannot be saved
+        vehicle.lease_options.append(quote)
+        return quote
+
+    def reprice_leases(self, apr):
+        """Re-quote every saved lease at a new APR; returns (quotes updated, quotes considered).
+
+        Quotes saved with terms quote_lease would now reject are left as they are.
+        """
+        _check_apr(apr)
+        quotes = [quote for vehicle in self.inventory for quote in vehicle.lease_options]
+        updated = reprice_lease_quotes([quote for quote in quotes if quote.price is not None
+                                        and _has_valid_lease_terms(quote)], apr)
+        if self.db is not None:
+            self.db.queue_lease_updates(updated)
+        return updated, len(quotes)
+
+    # Appointments
+
+    def open_service_slots(self, start, count=10, duration=1):
+        return self.service_capacity.open_slots(start, count, duration)
+
+    def book_service(self, customer, vin, day, hour, bay=None, duration=1):
+        """Book a service job on bay, or the first bay free for its duration, and return the appointment."""
+        day = _appointment_datetime(day)
+        appointment = {"customer": customer, "vin": vin, "date": day, "hour": f"{hour:02d}:00",
+                       "duration": duration}
+        appointment["bay"] = self.service_capacity.reserve(appointment, day, hour, bay, duration)
+        self.service_appointments.append(appointment)
+        if self.db is not None:
+            self.db.queue_appointment("service", appointment)
+        return appointment
+
+    def book_sales(self, customer, day, hour):
+        """Book a sales appointment with the least-loaded salesman free at that hour and return it."""
+        day = _appointment_datetime(day)
+        appointment = {"customer": customer, "date": day, "hour": f"{hour:02d}:00", "salesman": None}
+        appointment["salesman"] = self.sales_assigner.assign(appointment, day, hour)
+        self.sales_appointments.append(appointment)
+        if self.db is not None:
+            self.db.queue_appointment("sales", appointment)
+        return appointment
@@ -0,0 +1,154 @@
+import csv
+
+# numpy is imported inside the vectorized functions, so importing this module
+# (and with it the desktop app) does not pay numpy's import cost up front.
+
+# Financing terms offered by the quote popups: 60-144 months in steps of 12
+FINANCING_TERMS = list(range(60, 145, 12))
+
+
+def monthly_payment(principal, months, apr):
+    """Amortized monthly payment for a loan at apr percent per year."""
+    monthly_rate = apr / 100 / 12
+    if monthly_rate == 0:
+        return principal / months
+    return (principal * monthly_rate) / (1 - (1 + monthly_rate) ** -months)
+
+
+def amortization_schedule(principal, months, apr):
+    """Yield (month, payment, principal paid, interest, balance) for each month.
+
+    Rows are produced on demand, so callers can page through a schedule or
+    stream it to a file without holding every row.
+    """
+    payment = monthly_payment(principal, months, apr)
+    monthly_rate = apr / 100 / 12
+    balance = principal
+    for month in range(1, months + 1):
+        interest = balance * monthly_rate
+        principal_paid = payment - interest
+        if month == months:
+            # Absorb floating point drift so the loan closes at exactly zero.
+            principal_paid = balance
+            payment = principal_paid + interest
+        balance -= principal_paid
+        yield month, payment, principal_paid, interest, balance
+
+
+def inventory_schedules(vehicles, money_down, months, apr):
+    """Yield (vin, schedule row) for every vehicle, one vehicle's rows at a time."""
+    for vehicle in vehicles:
+        principal = vehicle.price - money_down
+        if principal <= 0:
+            continue
+        for row in amortization_schedule(principal, months, apr):
+            yield (vehicle.vin, *row)
+
+
+SCHEDULE_CSV_HEADER = ["VIN", "Month", "Payment", "Principal", "Interest", "Balance"]
+
+
+def write_schedule_csv(rows, f):
+    """Stream (vin, month, payment, principal, interest, balance) rows to a CSV file object."""
+    writer = csv.writer(f)
+    writer.writerow(SCHEDULE_CSV_HEADER)
+    count = 0
+    for vin, month, payment, principal, interest, balance in rows:
+        writer.writerow([vin, month, f"{payment:.2f}", f"{principal:.2f}", f"{interest:.2f}", f"{balance:.2f}"])
+        count += 1
+    return count
+
+
+def export_schedules_csv(path, vehicles, money_down, months, apr):
+    """Write every vehicle's schedule to a CSV file; returns the row count.
+
+    A plain module-level function so it can run in a worker process.
+    """
+    with open(path, "w", newline="") as f:
+        return write_schedule_csv(inventory_schedules(vehicles, money_down, months, apr), f)
+
+
+def payment_matrix(principals, terms, aprs):
+    """Amortized payments for every principal x term x APR in one computation.
+
+    Returns an array of shape (len(principals), len(terms), len(aprs)).
+    Non-positive principals give NaN rather than a payment.
+    """
+    import numpy as np
+    principal = np.asarray(principals, dtype=float)[:, None, None]
+    months = np.asarray(terms, dtype=float)[None, :, None]
+    rate = np.asarray(aprs, dtype=float)[None, None, :] / 100 / 12
+    with np.errstate(divide="ignore", invalid="ignore"):
+        amortized = principal * rate / (1 - (1 + rate) ** -months)
+    payments = np.where(rate == 0, principal / months, amortized)
+    return np.where(principal > 0, payments, np.nan)
+
+
+def quote_matrix(prices, down_payments, terms=FINANCING_TERMS, aprs=(3.5,)):
+    """Payments for every vehicle price x down payment x term x APR.
+
+    Returns an array of shape (len(prices), len(down_payments), len(terms),
+    len(aprs)); combinations where the down payment covers the price are NaN.
+    """
+    import numpy as np
+    prices = np.asarray(prices, dtype=float)
+    down_payments = np.asarray(down_payments, dtype=float)
+    principals = (prices[:, None] - down_payments[None, :]).ravel()
+    payments = payment_matrix(principals, terms, aprs)
+    return payments.reshape(len(prices), len(down_payments), len(terms), len(aprs))
+
+
+class QuoteTable:
+    """A quote matrix flattened for display and sorting.
+
+    Each row is one vehicle x down payment x APR combination and holds one
+    payment per term. Sorting is an argsort over a whole column, so the
+    table can be reordered without touching individual rows.
+    """
+    KEY_COLUMNS = ("VIN", "Price", "Down", "APR")
+
+    def __init__(self, vins, prices, down_payments, terms=FINANCING_TERMS, aprs=(3.5,)):
+        import numpy as np
+        vins = np.asarray(vins, dtype=str)
+        prices = np.asarray(prices, dtype=float)
+        down_payments = np.asarray(down_payments, dtype=float)
+        aprs = np.asarray(aprs, dtype=float)
+        self.terms = list(terms)
+        payments = quote_matrix(prices, down_payments, self.terms, aprs)
+        # (vehicle, down, term, apr) -> rows of (vehicle, down, apr), columns of term
+        self.payments = payments.transpose(0, 1, 3, 2).reshape(-1, len(self.terms))
+        per_vehicle = len(down_payments) * len(aprs)
+        self.keys = {
+            "VIN": np.repeat(vins, per_vehicle),
+            "Price": np.repeat(prices, per_vehicle),
+            "Down": np.tile(np.repeat(down_payments, len(aprs)), len(prices)),
+            "APR": np.tile(aprs, len(prices) * len(down_payments)),
+        }
+        self.order = np.arange(len(self.payments))
+
+    def __len__(self):
+        return len(self.payments)
+
+    @property
+    def columns(self):
+        return list(self.KEY_COLUMNS) + [f"{term} mo" for term in self.terms]
+
+    def sort(self, column, descending=False):
+        """Reorder rows by a column name from ``columns``; NaN payments sort last."""
+        import numpy as np
+        if column in self.keys:
+            values = self.keys[column]
+        else:
+            values = self.payments[:, self.columns.index(column) - len(self.KEY_COLUMNS)]
+        if descending and values.dtype.kind == "f":
+            self.order = np.argsort(-values, kind="stable")
+        elif descending:
+            self.order = np.argsort(values, kind="stable")[::-1]
+        else:
+            self.order = np.argsort(values, kind="stable")
+
+    def rows(self, limit=None):
+        """Yield display rows (vin, price, down, apr, payments...) in sorted order."""
+        for i in self.order[:limit]:
+            yield (self.keys["VIN"][i], self.keys["Price"][i], self.keys["Down"][i], self.keys["APR"][i],
+                   *self.payments[i])
@@ -0,0 +1,96 @@
+import csv
+import json
+import os
+
+from .inventory_store import Vehicle
+
+# Fields every imported record must carry, as checked by DealershipCore.add_vehicle.
+REQUIRED_FIELDS = ("type", "make", "model", "year", "vin", "price")
+# Records validated per step, e.g. per progress report from a worker thread.
+IMPORT_CHUNK_SIZE = 500
+
+
+class InventoryImport:
+    """Streaming bulk import of a CSV or JSONL inventory feed.
+
+    The file is read lazily and validated one chunk at a time through
+    steps(), which yields the fraction of the file consumed so a caller can
+    interleave it with other work. Nothing touches the store until apply(),
+    which adds every valid vehicle in one batch.
+    """
+
+    def __init__(self, path, store, chunk_size=IMPORT_CHUNK_SIZE):
+        self.path = path
+        self.store = store
+        self.chunk_size = chunk_size
+        self.total_bytes = max(os.path.getsize(path), 1)
+        self.bytes_read = 0
+        self.vehicles = []
+        self.errors = []      # (line number, message)
+        self.seen_vins = set()
+
+    def _lines(self):
+        with open(self.path, "rb") as f:
+            for raw in f:
+                self.bytes_read += len(raw)
+                yield raw.decode("utf-8-sig")
+
+    def records(self):
+        """Yield (line number, record dict) pairs from the feed."""
+        extension = os.path.splitext(self.path)[1].lower()
+        if extension == ".csv":
+            reader = csv.DictReader(self._lines())
+            for row in reader:
+                yield reader.line_num, {str(k).strip().lower(): v for k, v in row.items() if k is not None}
+        elif extension in (".jsonl", ".ndjson"):
+            for line_no, line in enumerate(self._lines(), start=1):
+                if not line.strip():
+                    continue
+                try:
+                    record = json.loads(line)
+                except ValueError as e:
+                    self.errors.append((line_no, f"Invalid JSON: {e}"))
+                    continue
+                if not isinstance(record, dict):
+                    self.errors.append((line_no, "Expected a JSON object."))
+                    continue
+                yield line_no, {str(k).strip().lower(): v for k, v in record.items()}
+        else:
+            raise ValueError(f"Unsupported import file type {extension!r}; use .csv or .jsonl.")
+
+    def validate(self, line_no, record):
+        fields = {name: str(record.get(name) or "").strip() for name in REQUIRED_FIELDS}
+        missing = [name for name, value in fields.items() if not value]
+        if missing:
+            self.errors.append((line_no, f"Missing required field(s): {', '.join(missing)}"))
+            return
+        try:
+            vehicle = Vehicle.from_fields(**fields)
+        except ValueError as e:
+            self.errors.append((line_no, str(e)))
+            return
+        if vehicle.vin in self.seen_vins or vehicle.vin in self.store:
+            self.errors.append((line_no, f"Duplicate VIN {vehicle.vin}."))
+            return
+        self.seen_vins.add(vehicle.vin)
+        self.vehicles.append(vehicle)
+
+    def steps(self):
+        """Validate the feed one chunk per iteration, yielding progress in [0, 1]."""
+        count = 0
+        for line_no, record in self.records():
+            self.validate(line_no, record)
+            count += 1
+            if count % self.chunk_size == 0:
+                yield min(self.bytes_read / self.total_bytes, 1.0)
+        yield 1.0
+
+    def run(self):
+        """Validate the whole feed without yielding control."""
+        for _ in self.steps():
+            pass
+
+    def apply(self):
+        """Add all validated vehicles to the store in one batch."""
+        self.store.add_many(self.vehicles)
+        return self.vehicles
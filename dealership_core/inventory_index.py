@@ -0,0 +1,104 @@
+from collections import defaultdict
+
+# Length of the model substrings kept in the n-gram index.
+NGRAM_SIZE = 3
+
+
+def _ngrams(text, n=NGRAM_SIZE):
+    """Return the set of n-character substrings of text."""
+    return {text[i:i + n] for i in range(len(text) - n + 1)}
+
+
+class InventoryIndex:
+    """Postings index over inventory vehicles for fast search.
+
+    Vehicles are identified by the integer id they were added with (their
+    position in the InventoryStore). Make and year are kept as postings per
+    distinct value, type as exact-match postings, and model through an n-gram
+    index over the distinct model names.
+    """
+
+    def __init__(self):
+        self.size = 0
+        self.make_postings = defaultdict(set)    # lowered make -> item ids
+        self.type_postings = defaultdict(set)    # lowered type -> item ids
+        self.year_postings = defaultdict(set)    # lowered year -> item ids
+        self.model_postings = defaultdict(set)   # lowered model -> item ids
+        self.model_ngrams = defaultdict(set)     # n-gram -> lowered models containing it
+
+    def add(self, item_id, item):
+        """Index one vehicle under the given id."""
+        self.make_postings[item.make.lower()].add(item_id)
+        self.type_postings[item.type.lower()].add(item_id)
+        self.year_postings[str(item.year).lower()].add(item_id)
+        model = item.model.lower()
+        if model not in self.model_postings:
+            for gram in _ngrams(model):
+                self.model_ngrams[gram].add(model)
+        self.model_postings[model].add(item_id)
+        self.size = max(self.size, item_id + 1)
+
+    def _substring_postings(self, postings, query):
+        """Union the postings of every distinct value containing query."""
+        result = set()
+        for value, ids in postings.items():
+            if query in value:
+                result |= ids
+        return result
+
+    def _model_postings(self, query):
+        if len(query) < NGRAM_SIZE:
+            return self._substring_postings(self.model_postings, query)
+        candidates = None
+        for gram in sorted(_ngrams(query), key=lambda g: len(self.model_ngrams.get(g, ()))):
+            models = self.model_ngrams.get(gram)
+            if not models:
+                return set()
+            candidates = set(models) if candidates is None else candidates & models
+            if not candidates:
+                return set()
+        result = set()
+        for model in candidates:
+            # n-gram hits are only candidates; confirm the actual substring.
+            if query in model:
+                result |= self.model_postings[model]
+        return result
+
+    def search(self, make="all", model="", item_type="all", year=""):
+        """Return the sorted ids of items matching the search filters.
+
+        Arguments are the lowered, stripped search box values and follow the
+        Inventory tab semantics: make, model and year match as substrings,
+        type matches exactly, and "all" / empty disables a filter.
+        """
+        postings = []
+        if make != "all":
+            postings.append(self._substring_postings(self.make_postings, make))
+        if model:
+            postings.append(self._model_postings(model))
+        if item_type != "all":
+            postings.append(self.type_postings.get(item_type, set()))
+        if year:
+            postings.append(self._substring_postings(self.year_postings, year))
+        if not postings:
+            return list(range(self.size))
+        postings.sort(key=len)
+        result = set(postings[0])
+        for ids in postings[1:]:
+            if not result:
+                break
+            result &= ids
+        return sorted(result)
+
+
+def item_matches(item, make="all", model="", item_type="all", year=""):
+    """Check one item against the same filters InventoryIndex.search applies."""
+    if make != "all" and make not in item.make.lower():
+        return False
+    if model and model not in item.model.lower():
+        return False
+    if item_type != "all" and item_type != item.type.lower():
+        return False
+    if year and year not in str(item.year).lower():
+        return False
+    return True
@@ -0,0 +1,167 @@
+import math
+from array import array
+from threading import RLock
+
+from .inventory_index import InventoryIndex
+
+# Accepted model years and prices; the database columns hold no more.
+MIN_YEAR = 1886
+MAX_YEAR = 2100
+MAX_PRICE = 9999999999.99
+
+
+def parse_price(text):
+    """Parse a price typed as e.g. "45000", "45,000.00" or "$45,000"."""
+    try:
+        price = float(str(text).replace("$", "").replace(",", "").strip())
+    except ValueError:
+        raise ValueError(f"Price must be a number, got {text!r}.") from None
+    # float() also accepts "nan" and "inf".
+    if not math.isfinite(price) or not 0 <= price <= MAX_PRICE:
+        raise ValueError(f"Price must be between 0 and {MAX_PRICE:,.2f}, got {text!r}.")
+    return price
+
+
+def parse_year(text):
+    try:
+        year = int(str(text).strip())
+    except ValueError:
+        raise ValueError(f"Year must be a whole number, got {text!r}.") from None
+    if not MIN_YEAR <= year <= MAX_YEAR:
+        raise ValueError(f"Year must be between {MIN_YEAR} and {MAX_YEAR}, got {text!r}.")
+    return year
+
+
+class DuplicateVinError(ValueError):
+    """Raised when a vehicle is added with a VIN already in the store."""
+
+
+class FinancingQuote:
+    """A saved financing quote for one vehicle."""
+    __slots__ = ("payment", "months", "apr")
+
+    def __init__(self, payment, months, apr):
+        self.payment = payment
+        self.months = months
+        self.apr = apr
+
+    def __str__(self):
+        return f"${self.payment:.2f}/month for {self.months} months at {self.apr}% APR"
+
+
+class LeaseQuote:
+    """A saved lease quote for one vehicle.
+
+    The pricing inputs are kept so the quote can be repriced when rates
+    change; they are None for quotes saved before the lease engine.
+    """
+    __slots__ = ("payment", "months", "apr", "price", "money_down", "residual_pct",
+                 "acquisition_fee", "tax_rate", "db_id")
+
+    def __init__(self, payment, months, apr, price=None, money_down=0.0, residual_pct=None,
+                 acquisition_fee=0.0, tax_rate=0.0, db_id=None):
+        self.payment = payment
+        self.months = months
+        self.apr = apr
+        self.price = price
+        self.money_down = money_down
+        self.residual_pct = residual_pct
+        self.acquisition_fee = acquisition_fee
+        self.tax_rate = tax_rate
+        self.db_id = db_id
+
+    def __str__(self):
+        return f"${self.payment:.2f}/month for {self.months} months at {self.apr}% APR (Lease)"
+
+
+class Vehicle:
+    """One inventory unit. Price and year are numeric; quotes are typed records."""
+    __slots__ = ("type", "make", "model", "year", "vin", "price", "financing_options", "lease_options")
+
+    def __init__(self, type, make, model, year, vin, price):
+        self.type = type
+        self.make = make
+        self.model = model
+        self.year = year
+        self.vin = vin
+        self.price = price
+        self.financing_options = []
+        self.lease_options = []
+
+    @classmethod
+    def from_fields(cls, type, make, model, year, vin, price):
+        """Build a vehicle from the raw strings of the inventory form."""
+        return cls(type.strip(), make.strip(), model.strip(), parse_year(year), vin.strip(), parse_price(price))
+
+    def __repr__(self):
+        return f"Vehicle({self.year} {self.make} {self.model}, VIN {self.vin}, ${self.price:,.2f})"
+
+
+class InventoryStore:
+    """Ordered container of Vehicle records with a search index.
+
+    Vehicles are identified by their position in the store, which is also
+    the id used by the InventoryIndex postings. A VIN-keyed dict gives O(1)
+    lookup and rejects duplicate VINs, and ``vins`` keeps the VINs in store
+    order for dropdowns. Writes and searches hold a lock so searches can
+    run on worker threads while the GUI keeps adding vehicles.
+    """
+
+    def __init__(self):
+        self.vehicles = []
+        self.vins = []
+        self.by_vin = {}
+        self.index = InventoryIndex()
+        self.lock = RLock()
+
+    def __len__(self):
+        return len(self.vehicles)
+
+    def __iter__(self):
+        return iter(self.vehicles)
+
+    def __getitem__(self, position):
+        return self.vehicles[position]
+
+    def __contains__(self, vin):
+        return vin in self.by_vin
+
+    def get(self, vin):
+        """Return the vehicle with this VIN, or None."""
+        return self.by_vin.get(vin)
+
+    def add(self, vehicle):
+        with self.lock:
+            if vehicle.vin in self.by_vin:
+                raise DuplicateVinError(f"VIN {vehicle.vin} is already in inventory.")
+            self.index.add(len(self.vehicles), vehicle)
+            self.vehicles.append(vehicle)
+            self.vins.append(vehicle.vin)
+            self.by_vin[vehicle.vin] = vehicle
+
+    def add_many(self, vehicles):
+        """Add a batch of vehicles; nothing is added if any VIN is a duplicate."""
+        with self.lock:
+            batch_vins = set()
+            for vehicle in vehicles:
+                if vehicle.vin in self.by_vin or vehicle.vin in batch_vins:
+                    raise DuplicateVinError(f"VIN {vehicle.vin} is already in inventory.")
+                batch_vins.add(vehicle.vin)
+            for vehicle in vehicles:
+                self.add(vehicle)
+
+    def search(self, make="all", model="", item_type="all", year=""):
+        """Return vehicles matching the Inventory tab filters, in store order."""
+        with self.lock:
+            return [self.vehicles[i] for i in self.index.search(make, model, item_type, year)]
+
+    def columns(self):
+        """Export the inventory as columns; numeric fields as typed arrays."""
+        return {
+            "type": [v.type for v in self.vehicles],
+            "make": [v.make for v in self.vehicles],
+            "model": [v.model for v in self.vehicles],
+            "year": array("i", (v.year for v in self.vehicles)),
+            "vin": [v.vin for v in self.vehicles],
+            "price": array("d", (v.price for v in self.vehicles)),
+        }
@@ -0,0 +1,86 @@
+import math
+
+# numpy is imported inside lease_payments, the one vectorized function, to keep it
+# out of the app's startup.
+
+# Lease terms offered by the lease popup: 12-36 months
+LEASE_TERMS = list(range(12, 37))
+# Defaults for the lease popup fields
+DEFAULT_RESIDUAL_PCT = 55.0
+DEFAULT_ACQUISITION_FEE = 895.0
+DEFAULT_TAX_RATE = 0.0
+
+
+def money_factor(apr):
+    """Money factor equivalent of an APR in percent (APR / 2400)."""
+    return apr / 2400
+
+
+def lease_breakdown(price, money_down, months, apr, residual_pct=DEFAULT_RESIDUAL_PCT,
+                    acquisition_fee=DEFAULT_ACQUISITION_FEE, tax_rate=DEFAULT_TAX_RATE):
+    """Price one lease and return its components.
+
+    The adjusted capitalized cost (price plus acquisition fee, less money
+    down) depreciates to the residual value over the term; the rent charge
+    is the money factor applied to capitalized cost plus residual; sales tax
+    is charged on the monthly payment.
+    """
+    cap_cost = price + acquisition_fee - money_down
+    residual = price * residual_pct / 100
+    if cap_cost <= residual:
+        raise ValueError("Money down must leave the capitalized cost above the residual value.")
+    depreciation = (cap_cost - residual) / months
+    rent_charge = (cap_cost + residual) * money_factor(apr)
+    tax = (depreciation + rent_charge) * tax_rate / 100
+    return {
+        "cap_cost": cap_cost,
+        "residual": residual,
+        "money_factor": money_factor(apr),
+        "depreciation": depreciation,
+        "rent_charge": rent_charge,
+        "tax": tax,
+        "payment": depreciation + rent_charge + tax,
+    }
+
+
+def lease_payment(price, money_down, months, apr, residual_pct=DEFAULT_RESIDUAL_PCT,
+                  acquisition_fee=DEFAULT_ACQUISITION_FEE, tax_rate=DEFAULT_TAX_RATE):
+    """Monthly lease payment including tax; see lease_breakdown."""
+    return lease_breakdown(price, money_down, months, apr, residual_pct, acquisition_fee, tax_rate)["payment"]
+
+
+def lease_payments(prices, money_down, months, apr, residual_pct=DEFAULT_RESIDUAL_PCT,
+                   acquisition_fee=DEFAULT_ACQUISITION_FEE, tax_rate=DEFAULT_TAX_RATE):
+    """Vectorized lease_payment; arguments are scalars or arrays that broadcast together.
+
+    Leases whose capitalized cost does not exceed the residual are NaN.
+    """
+    import numpy as np
+    prices = np.asarray(prices, dtype=float)
+    cap_cost = prices + np.asarray(acquisition_fee, dtype=float) - np.asarray(money_down, dtype=float)
+    residual = prices * np.asarray(residual_pct, dtype=float) / 100
+    depreciation = (cap_cost - residual) / np.asarray(months, dtype=float)
+    rent_charge = (cap_cost + residual) * money_factor(np.asarray(apr, dtype=float))
+    payments = (depreciation + rent_charge) * (1 + np.asarray(tax_rate, dtype=float) / 100)
+    return np.where(cap_cost > residual, payments, np.nan)
+
+
+def reprice_lease_quotes(quotes, apr):
+    """Re-quote saved LeaseQuotes at a new APR in one batch; returns the quotes updated.
+
+    Quotes without their pricing inputs (saved before the lease engine) are
+    left untouched.
+    """
+    quotes = [quote for quote in quotes if quote.price is not None]
+    if not quotes:
+        return []
+    payments = lease_payments([q.price for q in quotes], [q.money_down for q in quotes],
+                              [q.months for q in quotes], apr, [q.residual_pct for q in quotes],
+                              [q.acquisition_fee for q in quotes], [q.tax_rate for q in quotes])
+    updated = []
+    for quote, payment in zip(quotes, payments.tolist()):
+        if not math.isnan(payment):
+            quote.payment = payment
+            quote.apr = apr
+            updated.append(quote)
+    return updated
@@ -0,0 +1,89 @@
+from collections import OrderedDict
+from threading import Lock
+
+from .financing import monthly_payment
+from .leasing import lease_payment as compute_lease_payment
+
+# Distinct (principal, months, APR) combinations remembered per quote type
+QUOTE_CACHE_SIZE = 4096
+
+
+class QuoteCache:
+    """Bounded LRU cache around a payment function, with hit/miss counters.
+
+    Keys are the inputs after normalize() (amounts in cents, whole months,
+    rates to four decimals), so the same deal quoted on different vehicles
+    or with "3.5" vs "3.50" hits the same entry. Safe to share between
+    threads.
+    """
+
+    def __init__(self, compute, normalize, maxsize=QUOTE_CACHE_SIZE):
+        self.compute = compute
+        self.normalize = normalize
+        self.maxsize = maxsize
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.lock = Lock()
+
+    def payment(self, *args):
+        key = self.normalize(*args)
+        with self.lock:
+            if key in self.entries:
+                self.entries.move_to_end(key)
+                self.hits += 1
+                return self.entries[key]
+        value = self.compute(*key)
+        with self.lock:
+            self.misses += 1
+            self.entries[key] = value
+            if len(self.entries) > self.maxsize:
+                self.entries.popitem(last=False)
+        return value
+
+    def stats(self):
+        with self.lock:
+            lookups = self.hits + self.misses
+            return {"hits": self.hits, "misses": self.misses, "size": len(self.entries),
+                    "maxsize": self.maxsize, "hit_rate": self.hits / lookups if lookups else 0.0}
+
+    def clear(self):
+        with self.lock:
+            self.entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+
+def _money(value):
+    return round(float(value), 2)
+
+
+def _rate(value):
+    return round(float(value), 4)
+
+
+def _financing_key(principal, months, apr):
+    return _money(principal), int(months), _rate(apr)
+
+
+def _lease_key(price, money_down, months, apr, residual_pct, acquisition_fee, tax_rate):
+    return (_money(price), _money(money_down), int(months), _rate(apr), _rate(residual_pct),
+            _money(acquisition_fee), _rate(tax_rate))
+
+
+financing_cache = QuoteCache(monthly_payment, _financing_key)
+lease_cache = QuoteCache(compute_lease_payment, _lease_key)
+
+
+def financing_payment(principal, months, apr):
+    """Cached amortized monthly payment, as quoted by the financing popup."""
+    return financing_cache.payment(principal, months, apr)
+
+
+def lease_payment(price, money_down, months, apr, residual_pct, acquisition_fee, tax_rate):
+    """Cached monthly lease payment from the lease engine, as quoted by the lease popup."""
+    return lease_cache.payment(price, money_down, months, apr, residual_pct, acquisition_fee, tax_rate)
+
+
+def cache_stats():
+    return {"financing": financing_cache.stats(), "lease": lease_cache.stats()}
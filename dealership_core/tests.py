@@ -0,0 +1,188 @@
+"""Unit tests for the headless core: python -m unittest dealership_core.tests"""
+import random
+import unittest
+from datetime import date, datetime, timedelta
+
+from .appointments import (BUSINESS_HOURS, SALESMEN, SERVICE_BAYS, AppointmentBook, SalesAssigner, ServiceCapacity,
+                           SlotConflictError)
+from .inventory_index import item_matches
+from .inventory_store import InventoryStore, Vehicle
+
+MAKES = ["Ford", "Kia", "Honda", "Toyota", "Subaru"]
+MODELS = ["F-150", "Explorer", "Sorento", "Civic", "Corolla", "Outback", "CR-V", "Camry"]
+TYPES = ["Car", "Truck", "SUV"]
+MONDAY = date(2030, 3, 4)
+
+
+def random_inventory(rng, size):
+    return [Vehicle(rng.choice(TYPES), rng.choice(MAKES), rng.choice(MODELS), rng.randint(2010, 2025),
+                    f"VIN{i:05d}", float(rng.randint(5000, 90000))) for i in range(size)]
+
+
+def random_query(rng):
+    """Filters as the Inventory tab passes them: lowered and stripped, "all" or "" for none."""
+    def fragment(values):
+        value = rng.choice(values).lower()
+        start = rng.randrange(len(value))
+        return value[start:start + rng.randint(1, len(value))]
+
+    make = rng.choice(["all", "all", fragment(MAKES)])
+    model = rng.choice(["", "", fragment(MODELS), "zzz"])
+    item_type = rng.choice(["all", "all", rng.choice(TYPES).lower(), "van"])
+    year = rng.choice(["", "", str(rng.randint(2010, 2025)), str(rng.randint(2010, 2025))[-1], "20"])
+    return make, model, item_type, year
+
+
+class InventorySearchTests(unittest.TestCase):
+    """The index must return exactly what the original linear filter did, in store order."""
+
+    def test_index_matches_linear_filter(self):
+        rng = random.Random(1)
+        vehicles = random_inventory(rng, 2000)
+        store = InventoryStore()
+        store.add_many(vehicles)
+        for _ in range(400):
+            query = random_query(rng)
+            with self.subTest(query=query):
+                expected = [v.vin for v in vehicles if item_matches(v, *query)]
+                self.assertEqual([v.vin for v in store.search(*query)], expected)
+
+    def test_no_filters_returns_everything(self):
+        store = InventoryStore()
+        store.add_many(random_inventory(random.Random(2), 50))
+        self.assertEqual(store.search(), list(store))
+
+    def test_short_model_queries_match_substrings(self):
+        store = InventoryStore()
+        store.add_many([Vehicle("Car", "Honda", "CR-V", 2020, "A", 1.0),
+                        Vehicle("Car", "Kia", "Sorento", 2020, "B", 1.0)])
+        self.assertEqual([v.vin for v in store.search(model="r")], ["A", "B"])
+        self.assertEqual([v.vin for v in store.search(model="cr")], ["A"])
+
+
+def brute_force_open_slots(book, start, count, duration, max_days=60):
+    """Reference open_slots: test every hour and bay with AppointmentBook.is_free_for."""
+    first_day = start.date() if isinstance(start, datetime) else start
+    earliest = 0
+    if isinstance(start, datetime):
+        earliest = start.hour + (1 if start.minute or start.second or start.microsecond else 0)
+    slots = []
+    for offset in range(max_days):
+        day = first_day + timedelta(days=offset)
+        for hour in book.hours:
+            if offset == 0 and hour < earliest:
+                continue
+            free = [bay for bay in book.resources if book.is_free_for(day, hour, bay, duration)]
+            if free:
+                slots.append((day, hour, free[0]))
+                if len(slots) == count:
+                    return slots
+    return slots
+
+
+class ServiceCapacityTests(unittest.TestCase):
+    def setUp(self):
+        self.capacity = ServiceCapacity(AppointmentBook(SERVICE_BAYS))
+
+    def test_empty_calendar_opens_at_the_first_hour(self):
+        self.assertEqual(self.capacity.open_slots(MONDAY, 3),
+                         [(MONDAY, 8, "Bay 1"), (MONDAY, 9, "Bay 1"), (MONDAY, 10, "Bay 1")])
+
+    def test_datetime_start_skips_hours_already_started(self):
+        self.assertEqual(self.capacity.open_slots(datetime(2030, 3, 4, 9, 30), 1)[0], (MONDAY, 10, "Bay 1"))
+        self.assertEqual(self.capacity.open_slots(datetime(2030, 3, 4, 9, 0), 1)[0], (MONDAY, 9, "Bay 1"))
+
+    def test_job_needs_one_bay_for_its_whole_length(self):
+        self.capacity.reserve({}, MONDAY, 10, "Bay 1")
+        self.capacity.reserve({}, MONDAY, 9, "Bay 2")
+        self.capacity.reserve({}, MONDAY, 8, "Bay 3", duration=3)
+        # 08:00 and 09:00 have a free bay, but none stays free for three hours until 11:00.
+        self.assertEqual(self.capacity.open_slots(MONDAY, 2, duration=3),
+                         [(MONDAY, 10, "Bay 2"), (MONDAY, 11, "Bay 1")])
+
+    def test_jobs_may_not_run_past_closing(self):
+        slots = self.capacity.open_slots(MONDAY, 20, duration=4)
+        self.assertEqual(max(hour for day, hour, bay in slots if day == MONDAY), BUSINESS_HOURS[-1] - 3)
+
+    def test_reserve_uses_first_bay_free_for_the_duration_and_rejects_overbooking(self):
+        self.capacity.reserve({}, MONDAY, 11, "Bay 1")
+        self.assertEqual(self.capacity.reserve({}, MONDAY, 10, duration=2), "Bay 2")
+        self.capacity.reserve({}, MONDAY, 10, "Bay 3")
+        self.assertEqual(self.capacity.reserve({}, MONDAY, 10), "Bay 1")   # only 11:00 is taken on Bay 1
+        with self.assertRaises(SlotConflictError):
+            self.capacity.reserve({}, MONDAY, 10)
+
+    def test_matches_brute_force_on_random_calendars(self):
+        rng = random.Random(3)
+        for case in range(100):
+            capacity = ServiceCapacity(AppointmentBook(SERVICE_BAYS))
+            for _ in range(rng.randint(0, 60)):
+                day = MONDAY + timedelta(days=rng.randrange(4))
+                duration = rng.randint(1, 4)
+                hour = rng.choice(BUSINESS_HOURS[:len(BUSINESS_HOURS) - duration + 1])
+                try:
+                    capacity.reserve({}, day, hour, duration=duration)
+                except SlotConflictError:
+                    pass
+            start = rng.choice([MONDAY, datetime(2030, 3, 4, rng.randint(7, 19), rng.choice([0, 30]))])
+            duration = rng.randint(1, 4)
+            with self.subTest(case=case):
+                self.assertEqual(capacity.open_slots(start, 10, duration),
+                                 brute_force_open_slots(capacity.book, start, 10, duration))
+
+
+class SalesAssignerTests(unittest.TestCase):
+    def setUp(self):
+        self.assigner = SalesAssigner(AppointmentBook(SALESMEN))
+
+    def test_least_loaded_with_ties_in_roster_order(self):
+        picked = [self.assigner.assign({}, MONDAY, hour) for hour in BUSINESS_HOURS[:5]]
+        self.assertEqual(picked, SALESMEN + [SALESMEN[0]])
+
+    def test_busy_salesmen_are_passed_over(self):
+        self.assigner.assign({}, MONDAY, 9)            # Chris
+        self.assigner.assign({}, MONDAY, 10)           # Anthony
+        self.assigner.assign({}, MONDAY, 11)           # Tyler
+        self.assigner.assign({}, MONDAY, 9)            # Zach, the one left with no bookings
+        # Everyone has one booking; Chris comes first in the roster but is busy at 09:00.
+        self.assertEqual(self.assigner.assign({}, MONDAY, 9), "Anthony")
+        self.assertEqual(self.assigner.assign({}, MONDAY, 9), "Tyler")
+
+    def test_loads_are_per_day(self):
+        self.assigner.assign({}, MONDAY, 9)
+        self.assertEqual(self.assigner.assign({}, MONDAY + timedelta(days=1), 9), "Chris")
+
+    def test_recorded_bookings_count_towards_load(self):
+        self.assigner.book.book({}, MONDAY, 8, "Chris", force=True)
+        self.assigner.record(MONDAY, "Chris")
+        self.assertEqual(self.assigner.assign({}, MONDAY, 12), "Anthony")
+
+    def test_shifts_limit_who_is_picked(self):
+        assigner = SalesAssigner(AppointmentBook(["Chris", "Newbie"]), {"Chris": (8, 12), "Newbie": (12, 19)})
+        self.assertEqual(assigner.assign({}, MONDAY, 9), "Chris")
+        self.assertEqual(assigner.assign({}, MONDAY, 13), "Newbie")
+        assigner.assign({}, MONDAY, 10)
+        with self.assertRaises(SlotConflictError):
+            assigner.assign({}, MONDAY, 10)
+
+    def test_unknown_salesman_in_shifts_is_rejected(self):
+        with self.assertRaises(ValueError):
+            SalesAssigner(AppointmentBook(SALESMEN), {"Newbie": (8, 19)})
+
+    def test_matches_least_loaded_scan_on_random_bookings(self):
+        rng = random.Random(4)
+        loads = {name: 0 for name in SALESMEN}
+        for _ in range(300):
+            hour = rng.choice(BUSINESS_HOURS)
+            free = [name for name in SALESMEN if self.assigner.book.is_free(MONDAY, hour, name)]
+            expected = min(free, key=lambda name: (loads[name], SALESMEN.index(name))) if free else None
+            if expected is None:
+                with self.assertRaises(SlotConflictError):
+                    self.assigner.assign({}, MONDAY, hour)
+                continue
+            self.assertEqual(self.assigner.assign({}, MONDAY, hour), expected)
+            loads[expected] += 1
+
+
+if __name__ == "__main__":
+    unittest.main()
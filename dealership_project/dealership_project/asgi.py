@@ -2,6 +2,9 @@
 ASGI config for dealership_project project.
 
 It exposes the ASGI callable as a module-level variable named ``application``.
+Serve it with an ASGI server, e.g. ``uvicorn dealership_project.asgi:application``,
+so the async API views (availability, inventory export) wait on the database
+without holding a worker thread per request.
 
 For more information on this file, see
 https://docs.djangoproject.com/en/5.1/howto/deployment/asgi/
@@ -0,0 +1,22 @@
+from django.contrib import admin
+
+from .models import Appointment, FinancingQuote, Inventory, LeaseQuote
+
+
+@admin.register(Inventory)
+class InventoryAdmin(admin.ModelAdmin):
+    list_display = ['vin', 'year', 'make', 'model', 'type', 'price']
+    list_filter = ['make', 'type', 'year']
+    search_fields = ['vin', 'model']
+
+
+@admin.register(FinancingQuote, LeaseQuote)
+class QuoteAdmin(admin.ModelAdmin):
+    list_display = ['inventory', 'payment', 'months', 'apr', 'created_at']
+    list_select_related = ['inventory']
+
+
+@admin.register(Appointment)
+class AppointmentAdmin(admin.ModelAdmin):
+    list_display = ['kind', 'customer', 'date', 'hour', 'vin', 'bay', 'salesman']
+    list_filter = ['kind', 'date']
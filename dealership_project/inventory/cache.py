@@ -0,0 +1,62 @@
+import hashlib
+import threading
+import time
+
+from django.core.cache import cache
+
+# Replaced whenever inventory or quotes change; every cached result key embeds it,
+# so one bump retires all earlier results without deleting them. Versions are
+# clock readings rather than a counter, so a version key that expires or is
+# culled never restarts at a number older results were cached under.
+VERSION_KEY = 'inventory:version'
+KEY_PREFIX = 'inventory:result'
+_MISSING = object()
+
+_stats_lock = threading.Lock()
+_stats = {'hits': 0, 'misses': 0}
+
+
+def inventory_version():
+    version = cache.get(VERSION_KEY)
+    if version is None:
+        cache.add(VERSION_KEY, time.time_ns(), timeout=None)
+        version = cache.get(VERSION_KEY)
+    return version
+
+
+def bump_inventory_version():
+    """Invalidate every cached inventory and quote result."""
+    # Not cache.incr(): backends without a native incr re-save the key with the default timeout.
+    version = max(time.time_ns(), (cache.get(VERSION_KEY) or 0) + 1)
+    cache.set(VERSION_KEY, version, timeout=None)
+
+
+def result_key(namespace, params):
+    """Cache key for one query: namespace, current version and the sorted query parameters."""
+    if hasattr(params, 'lists'):
+        params = [(name, values) for name, values in params.lists()]
+    else:
+        params = list(params.items())
+    digest = hashlib.md5(repr(sorted(params)).encode()).hexdigest()
+    return f"{KEY_PREFIX}:{namespace}:v{inventory_version()}:{digest}"
+
+
+def cached_result(namespace, params, compute):
+    """Return compute()'s result for these parameters, from the cache when the version still matches."""
+    key = result_key(namespace, params)
+    result = cache.get(key, _MISSING)
+    with _stats_lock:
+        _stats['hits' if result is not _MISSING else 'misses'] += 1
+    if result is _MISSING:
+        result = compute()
+        cache.set(key, result)
+    return result
+
+
+def cache_stats():
+    """Hit and miss counts for this process, with the current inventory version."""
+    with _stats_lock:
+        hits, misses = _stats['hits'], _stats['misses']
+    total = hits + misses
+    return {'hits': hits, 'misses': misses, 'hit_rate': hits / total if total else 0.0,
+            'version': inventory_version()}
@@ -0,0 +1,78 @@
+# Generated by Django 5.2.18 on 2026-10-17 19:30
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Appointment',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('kind', models.CharField(choices=[('service', 'Service'), ('sales', 'Sales')], max_length=10)),
+                ('customer', models.CharField(max_length=100)),
+                ('vin', models.CharField(blank=True, max_length=32)),
+                ('salesman', models.CharField(blank=True, max_length=50)),
+                ('date', models.DateField()),
+                ('hour', models.PositiveSmallIntegerField()),
+            ],
+            options={
+                'ordering': ['date', 'hour', 'id'],
+                'indexes': [models.Index(fields=['kind', 'date', 'hour'], name='appointment_slot_idx')],
+            },
+        ),
+        migrations.CreateModel(
+            name='Inventory',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('vin', models.CharField(max_length=32, unique=True)),
+                ('type', models.CharField(choices=[('New', 'New'), ('Used', 'Used')], max_length=10)),
+                ('make', models.CharField(max_length=50)),
+                ('model', models.CharField(max_length=100)),
+                ('year', models.PositiveSmallIntegerField()),
+                ('price', models.DecimalField(decimal_places=2, max_digits=12)),
+            ],
+            options={
+                'verbose_name_plural': 'inventory',
+                'ordering': ['id'],
+                'indexes': [models.Index(fields=['make', 'type', 'year'], name='inventory_make_type_year_idx'), models.Index(fields=['year'], name='inventory_year_idx')],
+            },
+        ),
+        migrations.CreateModel(
+            name='FinancingQuote',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('payment', models.DecimalField(decimal_places=2, max_digits=10)),
+                ('months', models.PositiveSmallIntegerField()),
+                ('apr', models.DecimalField(decimal_places=3, max_digits=6)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('inventory', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='financing_quotes', to='inventory.inventory')),
+            ],
+            options={
+                'ordering': ['id'],
+                'indexes': [models.Index(fields=['inventory', 'id'], name='financing_inventory_idx')],
+            },
+        ),
+        migrations.CreateModel(
+            name='LeaseQuote',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('payment', models.DecimalField(decimal_places=2, max_digits=10)),
+                ('months', models.PositiveSmallIntegerField()),
+                ('apr', models.DecimalField(decimal_places=3, max_digits=6)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('inventory', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='lease_quotes', to='inventory.inventory')),
+            ],
+            options={
+                'ordering': ['id'],
+                'indexes': [models.Index(fields=['inventory', 'id'], name='lease_inventory_idx')],
+            },
+        ),
+    ]
@@ -0,0 +1,38 @@
+# Generated by Django 5.2.18 on 2026-10-17 19:34
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('inventory', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='leasequote',
+            name='acquisition_fee',
+            field=models.DecimalField(decimal_places=2, default=0, max_digits=10),
+        ),
+        migrations.AddField(
+            model_name='leasequote',
+            name='money_down',
+            field=models.DecimalField(decimal_places=2, default=0, max_digits=12),
+        ),
+        migrations.AddField(
+            model_name='leasequote',
+            name='price',
+            field=models.DecimalField(blank=True, decimal_places=2, max_digits=12, null=True),
+        ),
+        migrations.AddField(
+            model_name='leasequote',
+            name='residual_pct',
+            field=models.DecimalField(blank=True, decimal_places=3, max_digits=6, null=True),
+        ),
+        migrations.AddField(
+            model_name='leasequote',
+            name='tax_rate',
+            field=models.DecimalField(decimal_places=3, default=0, max_digits=6),
+        ),
+    ]
@@ -0,0 +1,26 @@
+# Generated by Django 5.2.18 on 2026-10-17 19:36
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('inventory', '0002_lease_pricing_inputs'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='appointment',
+            name='bay',
+            field=models.CharField(blank=True, max_length=20),
+        ),
+        migrations.AddIndex(
+            model_name='appointment',
+            index=models.Index(fields=['date', 'hour', 'bay'], name='appointment_bay_slot_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='appointment',
+            index=models.Index(fields=['date', 'hour', 'salesman'], name='appointment_salesman_slot_idx'),
+        ),
+    ]
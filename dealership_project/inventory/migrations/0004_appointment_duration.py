@@ -0,0 +1,18 @@
+# Generated by Django 5.2.18 on 2026-10-17 19:41
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('inventory', '0003_appointment_resources'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='appointment',
+            name='duration',
+            field=models.PositiveSmallIntegerField(default=1, help_text='Hours the booking holds its bay'),
+        ),
+    ]
@@ -0,0 +1,21 @@
+# Generated by Django 5.2.18 on 2026-10-17 19:48
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('inventory', '0004_appointment_duration'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='inventory',
+            index=models.Index(fields=['make', 'id'], name='inventory_make_keyset_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='inventory',
+            index=models.Index(fields=['price'], name='inventory_price_idx'),
+        ),
+    ]
@@ -0,0 +1,88 @@
+from django.db import models
+
+
+class Inventory(models.Model):
+    """A vehicle on the lot, as entered in the desktop app's Inventory tab."""
+    TYPE_CHOICES = [('New', 'New'), ('Used', 'Used')]
+
+    vin = models.CharField(max_length=32, unique=True)
+    type = models.CharField(max_length=10, choices=TYPE_CHOICES)
+    make = models.CharField(max_length=50)
+    model = models.CharField(max_length=100)
+    year = models.PositiveSmallIntegerField()
+    price = models.DecimalField(max_digits=12, decimal_places=2)
+
+    class Meta:
+        ordering = ['id']
+        verbose_name_plural = 'inventory'
+        indexes = [
+            models.Index(fields=['make', 'type', 'year'], name='inventory_make_type_year_idx'),
+            models.Index(fields=['year'], name='inventory_year_idx'),
+            # API filters: keyset pages within one make, and price ranges
+            models.Index(fields=['make', 'id'], name='inventory_make_keyset_idx'),
+            models.Index(fields=['price'], name='inventory_price_idx'),
+        ]
+
+    def __str__(self):
+        return f"{self.year} {self.make} {self.model} ({self.vin})"
+
+
+class FinancingQuote(models.Model):
+    inventory = models.ForeignKey(Inventory, on_delete=models.CASCADE, related_name='financing_quotes')
+    payment = models.DecimalField(max_digits=10, decimal_places=2)
+    months = models.PositiveSmallIntegerField()
+    apr = models.DecimalField(max_digits=6, decimal_places=3)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        ordering = ['id']
+        indexes = [models.Index(fields=['inventory', 'id'], name='financing_inventory_idx')]
+
+    def __str__(self):
+        return f"${self.payment}/month for {self.months} months at {self.apr}% APR"
+
+
+class LeaseQuote(models.Model):
+    inventory = models.ForeignKey(Inventory, on_delete=models.CASCADE, related_name='lease_quotes')
+    payment = models.DecimalField(max_digits=10, decimal_places=2)
+    months = models.PositiveSmallIntegerField()
+    apr = models.DecimalField(max_digits=6, decimal_places=3)
+    # Lease engine inputs, kept so the quote can be repriced; null for older quotes.
+    price = models.DecimalField(max_digits=12, decimal_places=2, null=True, blank=True)
+    money_down = models.DecimalField(max_digits=12, decimal_places=2, default=0)
+    residual_pct = models.DecimalField(max_digits=6, decimal_places=3, null=True, blank=True)
+    acquisition_fee = models.DecimalField(max_digits=10, decimal_places=2, default=0)
+    tax_rate = models.DecimalField(max_digits=6, decimal_places=3, default=0)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        ordering = ['id']
+        indexes = [models.Index(fields=['inventory', 'id'], name='lease_inventory_idx')]
+
+    def __str__(self):
+        return f"${self.payment}/month for {self.months} months at {self.apr}% APR (Lease)"
+
+
+class Appointment(models.Model):
+    """A service or sales booking starting in one hourly slot of the scheduling grids."""
+    KIND_CHOICES = [('service', 'Service'), ('sales', 'Sales')]
+
+    kind = models.CharField(max_length=10, choices=KIND_CHOICES)
+    customer = models.CharField(max_length=100)
+    vin = models.CharField(max_length=32, blank=True)
+    bay = models.CharField(max_length=20, blank=True)
+    salesman = models.CharField(max_length=50, blank=True)
+    date = models.DateField()
+    hour = models.PositiveSmallIntegerField()
+    duration = models.PositiveSmallIntegerField(default=1, help_text="Hours the booking holds its bay")
+
+    class Meta:
+        ordering = ['date', 'hour', 'id']
+        indexes = [
+            models.Index(fields=['kind', 'date', 'hour'], name='appointment_slot_idx'),
+            models.Index(fields=['date', 'hour', 'bay'], name='appointment_bay_slot_idx'),
+            models.Index(fields=['date', 'hour', 'salesman'], name='appointment_salesman_slot_idx'),
+        ]
+
+    def __str__(self):
+        return f"{self.get_kind_display()}: {self.customer} on {self.date} at {self.hour:02d}:00"
@@ -0,0 +1,14 @@
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .cache import bump_inventory_version
+from .models import FinancingQuote, Inventory, LeaseQuote
+
+
+@receiver([post_save, post_delete], sender=Inventory)
+@receiver([post_save, post_delete], sender=FinancingQuote)
+@receiver([post_save, post_delete], sender=LeaseQuote)
+def invalidate_inventory_cache(sender, **kwargs):
+    # Bump only once the write is committed, so no reader caches the old rows under the new version.
+    transaction.on_commit(bump_inventory_version)
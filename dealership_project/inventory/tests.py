@@ -0,0 +1,223 @@
+import shutil
+import tempfile
+import time
+from datetime import date, datetime, timezone as dt_timezone
+from decimal import Decimal
+from unittest import mock
+
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from django.utils import timezone
+
+from dealership_core.appointments import SALESMEN, SERVICE_BAYS
+
+from . import views
+from .cache import VERSION_KEY, bump_inventory_version, inventory_version
+from .models import Appointment, FinancingQuote, Inventory, LeaseQuote
+
+# Each test run gets a fresh in-memory cache instead of the project's file cache.
+TEST_CACHES = {'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}}
+
+
+@override_settings(CACHES=TEST_CACHES)
+class InventoryApiTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        makes = ['Ford', 'Kia', 'Honda']
+        Inventory.objects.bulk_create([
+            Inventory(vin=f'VIN{i:03d}', type='Truck' if i % 5 == 0 else 'Car', make=makes[i % 3],
+                      model='Explorer' if i % 2 else 'Civic', year=2015 + i % 10, price=Decimal(10000 + i * 100))
+            for i in range(30)
+        ])
+
+    def get_list(self, **params):
+        return self.client.get(reverse('inventory:inventory-list'), params)
+
+    def vins(self, response):
+        return [row['vin'] for row in response.json()['results']]
+
+    def test_filters(self):
+        self.assertEqual(self.vins(self.get_list(make='Kia')),
+                         [f'VIN{i:03d}' for i in range(30) if i % 3 == 1])
+        self.assertEqual(self.vins(self.get_list(type='Truck')),
+                         [f'VIN{i:03d}' for i in range(0, 30, 5)])
+        self.assertEqual(self.vins(self.get_list(year='2017')), ['VIN002', 'VIN012', 'VIN022'])
+        self.assertEqual(len(self.vins(self.get_list(model='expl'))), 15)
+        self.assertEqual(self.vins(self.get_list(min_price='12500', max_price='12800')),
+                         ['VIN025', 'VIN026', 'VIN027', 'VIN028'])
+
+    def test_make_filter_is_exact(self):
+        self.assertEqual(self.vins(self.get_list(make='For')), [])
+
+    def test_invalid_parameters_are_bad_requests(self):
+        for params in [{'year': 'new'}, {'limit': '0'}, {'limit': 'ten'}, {'cursor': '-1'},
+                       {'min_price': 'cheap'}, {'min_price': 'NaN'}, {'max_price': 'Infinity'},
+                       {'max_price': '-Infinity'}, {'min_price': 'sNaN'}]:
+            with self.subTest(params=params):
+                response = self.get_list(**params)
+                self.assertEqual(response.status_code, 400)
+                self.assertIn('error', response.json())
+
+    def test_limit_is_capped(self):
+        Inventory.objects.bulk_create([
+            Inventory(vin=f'BULK{i:04d}', type='Car', make='Ford', model='F-150', year=2020, price=30000)
+            for i in range(views.API_MAX_PAGE_SIZE)
+        ])
+        response = self.get_list(limit=str(views.API_MAX_PAGE_SIZE * 2))
+        self.assertEqual(len(response.json()['results']), views.API_MAX_PAGE_SIZE)
+        self.assertIsNotNone(response.json()['next_cursor'])
+
+    def test_next_links_walk_every_row_once(self):
+        seen = []
+        url = f"{reverse('inventory:inventory-list')}?make=Ford&limit=3"
+        while url:
+            body = self.client.get(url).json()
+            seen.extend(row['vin'] for row in body['results'])
+            if body['next']:
+                self.assertIn('make=Ford', body['next'])
+                self.assertIn(f"cursor={body['next_cursor']}", body['next'])
+            url = body['next']
+        self.assertEqual(seen, [f'VIN{i:03d}' for i in range(0, 30, 3)])
+
+    def test_last_full_page_has_no_next(self):
+        body = self.get_list(limit='30').json()
+        self.assertEqual(len(body['results']), 30)
+        self.assertIsNone(body['next_cursor'])
+        self.assertIsNone(body['next'])
+
+    def test_cursor_past_the_end(self):
+        last_id = Inventory.objects.order_by('-id').values_list('id', flat=True).first()
+        body = self.get_list(cursor=str(last_id)).json()
+        self.assertEqual(body['results'], [])
+        self.assertIsNone(body['next'])
+
+    def test_detail_includes_quotes(self):
+        vehicle = Inventory.objects.get(vin='VIN004')
+        FinancingQuote.objects.create(inventory=vehicle, payment=Decimal('512.34'), months=60, apr=Decimal('3.5'))
+        LeaseQuote.objects.create(inventory=vehicle, payment=Decimal('399.00'), months=36, apr=Decimal('4.9'),
+                                  price=Decimal('10400'), residual_pct=Decimal('55'))
+        body = self.client.get(reverse('inventory:inventory-detail', args=['VIN004'])).json()
+        self.assertEqual(body['vin'], 'VIN004')
+        self.assertEqual(len(body['financing_quotes']), 1)
+        self.assertEqual(len(body['lease_quotes']), 1)
+
+    def test_detail_unknown_vin(self):
+        response = self.client.get(reverse('inventory:inventory-detail', args=['NOPE']))
+        self.assertEqual(response.status_code, 404)
+
+    def test_saves_invalidate_cached_lists(self):
+        self.assertEqual(len(self.vins(self.get_list(make='Tesla'))), 0)
+        with self.captureOnCommitCallbacks(execute=True):
+            Inventory.objects.create(vin='NEW1', type='Car', make='Tesla', model='3', year=2024, price=40000)
+        self.assertEqual(self.vins(self.get_list(make='Tesla')), ['NEW1'])
+
+    async def test_export_streams_filtered_rows(self):
+        response = await self.async_client.get(reverse('inventory:inventory-export'), {'make': 'Honda'})
+        self.assertEqual(response.status_code, 200)
+        body = b''.join([chunk async for chunk in response.streaming_content]).decode()
+        lines = body.splitlines()
+        self.assertEqual(lines[0], ','.join(views.EXPORT_FIELDS))
+        self.assertEqual([line.split(',')[0] for line in lines[1:]], [f'VIN{i:03d}' for i in range(2, 30, 3)])
+
+    async def test_export_rejects_non_finite_prices(self):
+        response = await self.async_client.get(reverse('inventory:inventory-export'), {'min_price': 'NaN'})
+        self.assertEqual(response.status_code, 400)
+
+
+class FileCacheVersionTests(TestCase):
+    """The inventory version against the project's own backend, where incr() resets the timeout."""
+
+    def setUp(self):
+        location = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, location, True)
+        override = override_settings(CACHES={'default': {
+            'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache',
+            'LOCATION': location,
+            'TIMEOUT': 300,
+        }})
+        override.enable()
+        self.addCleanup(override.disable)
+
+    def test_bumped_version_does_not_expire(self):
+        from django.core.cache import cache
+        first = inventory_version()
+        bump_inventory_version()
+        bumped = inventory_version()
+        self.assertGreater(bumped, first)
+        later = time.time() + 3600
+        with mock.patch('django.core.cache.backends.filebased.time.time', return_value=later):
+            self.assertEqual(cache.get(VERSION_KEY), bumped)
+
+    def test_lost_version_key_never_reuses_a_version(self):
+        from django.core.cache import cache
+        bump_inventory_version()
+        bumped = inventory_version()
+        cache.delete(VERSION_KEY)
+        self.assertGreater(inventory_version(), bumped)
+
+
+@override_settings(CACHES=TEST_CACHES)
+class AvailabilityTests(TestCase):
+    # A Monday morning in the dealership's local time; the day under test is the one after it.
+    NOW = datetime(2030, 3, 4, 9, 30)
+    DAY = date(2030, 3, 5)
+
+    def setUp(self):
+        self.set_now(self.NOW)
+
+    def set_now(self, now, utc_now=None):
+        """Pin the local wall clock the view reads and, optionally, Django's UTC clock."""
+        patcher = mock.patch.object(views, 'datetime', mock.Mock(wraps=datetime, now=mock.Mock(return_value=now)))
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        if utc_now is not None:
+            patcher = mock.patch.object(timezone, 'now', return_value=utc_now)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    async def get_open(self, kind, **params):
+        response = await self.async_client.get(reverse('inventory:availability', args=[kind]), params)
+        self.assertEqual(response.status_code, 200)
+        return {day['date']: {slot['hour']: slot['free'] for slot in day['open']} for day in response.json()['days']}
+
+    async def test_service_bays_free_for_the_job_length(self):
+        await Appointment.objects.acreate(kind='service', customer='A', date=self.DAY, hour=10,
+                                          bay=SERVICE_BAYS[0], duration=2)
+        open_hours = (await self.get_open('service', date=self.DAY.isoformat(), days='1', duration='2'))['2030-03-05']
+        self.assertEqual(open_hours['08:00'], SERVICE_BAYS)
+        self.assertEqual(open_hours['09:00'], SERVICE_BAYS[1:])
+        self.assertEqual(open_hours['11:00'], SERVICE_BAYS[1:])
+        self.assertEqual(open_hours['12:00'], SERVICE_BAYS)
+        self.assertNotIn('18:00', open_hours)   # a 2 hour job would run past closing
+
+    async def test_sales_lists_free_salesmen(self):
+        await Appointment.objects.acreate(kind='sales', customer='B', date=self.DAY, hour=14, salesman=SALESMEN[0])
+        open_hours = (await self.get_open('sales', date=self.DAY.isoformat(), days='1'))['2030-03-05']
+        self.assertEqual(open_hours['14:00'], SALESMEN[1:])
+        self.assertEqual(open_hours['15:00'], SALESMEN)
+
+    async def test_hours_already_started_are_not_offered(self):
+        days = await self.get_open('service', date='2030-03-03', days='3')
+        self.assertEqual(days['2030-03-03'], {})
+        self.assertEqual(min(days['2030-03-04']), '10:00')
+        self.assertEqual(min(days['2030-03-05']), '08:00')
+
+    async def test_defaults_to_today(self):
+        days = await self.get_open('service')
+        self.assertEqual(list(days)[0], '2030-03-04')
+        self.assertEqual(len(days), 7)
+
+    async def test_local_evening_when_utc_is_already_tomorrow(self):
+        # 17:10 in New York is 22:10 UTC in winter; pin UTC past midnight to be sure it is not used.
+        self.set_now(datetime(2030, 3, 4, 17, 10), utc_now=datetime(2030, 3, 5, 1, 10, tzinfo=dt_timezone.utc))
+        days = await self.get_open('service', days='2')
+        self.assertEqual(list(days), ['2030-03-04', '2030-03-05'])
+        self.assertEqual(list(days['2030-03-04']), ['18:00'])
+
+    async def test_bad_requests(self):
+        for params in [{'date': 'tomorrow'}, {'days': '0'}, {'duration': 'long'}]:
+            with self.subTest(params=params):
+                response = await self.async_client.get(reverse('inventory:availability', args=['service']), params)
+                self.assertEqual(response.status_code, 400)
+        response = await self.async_client.get(reverse('inventory:availability', args=['parts']))
+        self.assertEqual(response.status_code, 404)
@@ -0,0 +1,13 @@
+from django.urls import path
+
+from . import views
+
+app_name = 'inventory'
+
+urlpatterns = [
+    path('inventory/', views.inventory_list, name='inventory-list'),
+    path('inventory/export.csv', views.inventory_export, name='inventory-export'),
+    path('inventory/<str:vin>/', views.inventory_detail, name='inventory-detail'),
+    path('cache-stats/', views.inventory_cache_stats, name='cache-stats'),
+    path('availability/<str:kind>/', views.availability, name='availability'),
+]
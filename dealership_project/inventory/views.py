@@ -0,0 +1,237 @@
+import csv
+import io
+from datetime import date, datetime, timedelta
+from decimal import Decimal, InvalidOperation
+
+from django.http import Http404, JsonResponse, StreamingHttpResponse
+from django.views.decorators.http import require_GET
+
+from dealership_core.appointments import (SALES_SHIFTS, SALESMEN, SERVICE_BAYS, AppointmentBook, SalesAssigner,
+                                          ServiceCapacity)
+
+from .cache import cache_stats, cached_result
+from .models import Appointment, FinancingQuote, Inventory, LeaseQuote
+
+# Vehicles per page unless ?limit= asks for fewer or more, up to the maximum.
+API_PAGE_SIZE = 50
+API_MAX_PAGE_SIZE = 500
+# Columns returned for each vehicle; lists never load whole model instances.
+INVENTORY_FIELDS = ('id', 'vin', 'type', 'make', 'model', 'year', 'price')
+QUOTE_FIELDS = ('id', 'payment', 'months', 'apr')
+LEASE_FIELDS = QUOTE_FIELDS + ('price', 'money_down', 'residual_pct', 'acquisition_fee', 'tax_rate')
+# Columns of the CSV export, and rows fetched per query while streaming it.
+EXPORT_FIELDS = ('vin', 'type', 'make', 'model', 'year', 'price')
+EXPORT_BATCH_SIZE = 1000
+# Longest window the availability endpoint computes in one request.
+AVAILABILITY_MAX_DAYS = 31
+
+
+class BadRequest(ValueError):
+    """A query parameter the API cannot use; reported as a 400 with its message."""
+
+
+def _int_param(params, name, default=None, minimum=0):
+    value = params.get(name, '').strip()
+    if not value:
+        return default
+    try:
+        number = int(value)
+    except ValueError:
+        raise BadRequest(f"{name} must be a whole number.")
+    if number < minimum:
+        raise BadRequest(f"{name} must be at least {minimum}.")
+    return number
+
+
+def _decimal_param(params, name):
+    value = params.get(name, '').strip()
+    if not value:
+        return None
+    try:
+        number = Decimal(value)
+    except InvalidOperation:
+        raise BadRequest(f"{name} must be a number.")
+    # Decimal accepts "NaN" and "Infinity", which the ORM then rejects.
+    if not number.is_finite():
+        raise BadRequest(f"{name} must be a finite number.")
+    return number
+
+
+def filter_inventory(params):
+    """Apply the list filters in params to the inventory queryset.
+
+    make and type match exactly, as stored, so the make and year indexes
+    apply; model is a case-insensitive substring; min_price and max_price
+    bound the price.
+    """
+    rows = Inventory.objects.all()
+    if params.get('make'):
+        rows = rows.filter(make=params['make'])
+    if params.get('type'):
+        rows = rows.filter(type=params['type'])
+    year = _int_param(params, 'year')
+    if year is not None:
+        rows = rows.filter(year=year)
+    if params.get('model'):
+        rows = rows.filter(model__icontains=params['model'])
+    min_price = _decimal_param(params, 'min_price')
+    if min_price is not None:
+        rows = rows.filter(price__gte=min_price)
+    max_price = _decimal_param(params, 'max_price')
+    if max_price is not None:
+        rows = rows.filter(price__lte=max_price)
+    return rows
+
+
+def inventory_page(params):
+    """One keyset page of filtered inventory as (rows, next cursor or None).
+
+    The cursor is the last id of the previous page, so page N costs the same
+    as page 1: the query seeks past the cursor instead of counting an OFFSET.
+    """
+    limit = min(_int_param(params, 'limit', API_PAGE_SIZE, minimum=1), API_MAX_PAGE_SIZE)
+    cursor = _int_param(params, 'cursor', 0)
+    rows = list(filter_inventory(params).filter(id__gt=cursor).order_by('id')
+                .values(*INVENTORY_FIELDS)[:limit + 1])
+    next_cursor = rows[limit - 1]['id'] if len(rows) > limit else None
+    return rows[:limit], next_cursor
+
+
+def vehicle_detail(vin):
+    """A vehicle's fields with its saved financing and lease quotes, or None."""
+    vehicle = Inventory.objects.filter(vin=vin).values(*INVENTORY_FIELDS).first()
+    if vehicle is None:
+        return None
+    vehicle['financing_quotes'] = list(FinancingQuote.objects.filter(inventory_id=vehicle['id'])
+                                       .order_by('id').values(*QUOTE_FIELDS))
+    vehicle['lease_quotes'] = list(LeaseQuote.objects.filter(inventory_id=vehicle['id'])
+                                   .order_by('id').values(*LEASE_FIELDS))
+    return vehicle
+
+
+@require_GET
+def inventory_list(request):
+    """GET /api/inventory/?make=&model=&type=&year=&min_price=&max_price=&limit=&cursor="""
+    try:
+        rows, next_cursor = cached_result('list', request.GET, lambda: inventory_page(request.GET))
+    except BadRequest as e:
+        return JsonResponse({'error': str(e)}, status=400)
+    next_url = None
+    if next_cursor is not None:
+        params = request.GET.copy()
+        params['cursor'] = next_cursor
+        next_url = f"{request.path}?{params.urlencode()}"
+    return JsonResponse({'results': rows, 'next_cursor': next_cursor, 'next': next_url})
+
+
+@require_GET
+def inventory_detail(request, vin):
+    """GET /api/inventory/<vin>/ with the vehicle's saved quotes."""
+    vehicle = cached_result('detail', {'vin': vin}, lambda: vehicle_detail(vin))
+    if vehicle is None:
+        raise Http404(f"VIN {vin} is not in inventory.")
+    return JsonResponse(vehicle)
+
+
+@require_GET
+def inventory_cache_stats(request):
+    """GET /api/cache-stats/: this worker's result cache hit rate."""
+    return JsonResponse(cache_stats())
+
+
+async def load_appointment_book(kind, start, days):
+    """Index the kind's bookings from start for days the way the desktop app does.
+
+    Returns (book, scheduler): a ServiceCapacity for service, a
+    SalesAssigner (for the shifts) for sales.
+    """
+    if kind == 'service':
+        book = AppointmentBook(SERVICE_BAYS)
+        scheduler = ServiceCapacity(book)
+    else:
+        book = AppointmentBook(SALESMEN)
+        scheduler = SalesAssigner(book, SALES_SHIFTS)
+    rows = (Appointment.objects.filter(kind=kind, date__gte=start, date__lt=start + timedelta(days=days))
+            .values_list('date', 'hour', 'bay', 'salesman', 'duration'))
+    async for day, hour, bay, salesman, duration in rows:
+        # Saved bookings are kept as they are, even ones made before conflict checks.
+        if kind == 'service':
+            scheduler.reserve(None, day, hour, bay or None, duration, force=True)
+        else:
+            book.book(None, day, hour, salesman, force=True)
+    return book, scheduler
+
+
+@require_GET
+async def availability(request, kind):
+    """GET /api/availability/<service|sales>/?date=YYYY-MM-DD&days=7&duration=1
+
+    For each day, the hours that still have a free bay (for the whole job
+    length) or an on-shift salesman, with who or what is free. Like the
+    desktop app's open slots, hours that have already started are left out.
+    Appointments hold the desktop's local wall-clock dates and hours, so
+    "now" is the server's naive local time, as ServiceCapacity.open_slots
+    uses, not Django's (UTC) TIME_ZONE.
+    """
+    if kind not in ('service', 'sales'):
+        raise Http404(f"No availability for {kind}.")
+    try:
+        now = datetime.now()
+        start = date.fromisoformat(request.GET['date']) if request.GET.get('date') else now.date()
+        days = min(_int_param(request.GET, 'days', 7, minimum=1), AVAILABILITY_MAX_DAYS)
+        duration = _int_param(request.GET, 'duration', 1, minimum=1) if kind == 'service' else 1
+    except BadRequest as e:
+        return JsonResponse({'error': str(e)}, status=400)
+    except ValueError:
+        return JsonResponse({'error': "date must be YYYY-MM-DD."}, status=400)
+    book, scheduler = await load_appointment_book(kind, start, days)
+    earliest = now.hour + (1 if now.minute or now.second or now.microsecond else 0)
+    result = []
+    for offset in range(days):
+        day = start + timedelta(days=offset)
+        hours = []
+        for hour in book.hours:
+            if day < now.date() or (day == now.date() and hour < earliest):
+                continue
+            free = book.free_resources(day, hour, duration)
+            if kind == 'sales':
+                free = [name for name in free if name in scheduler.shifts and scheduler.on_shift(name, hour)]
+            if free:
+                hours.append({'hour': f"{hour:02d}:00", 'free': free})
+        result.append({'date': day.isoformat(), 'open': hours})
+    return JsonResponse({'kind': kind, 'duration': duration, 'days': result})
+
+
+async def export_csv_chunks(rows):
+    """Yield rows as CSV text: the header, then one chunk per keyset batch."""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(EXPORT_FIELDS)
+    yield buffer.getvalue()
+    cursor = 0
+    while True:
+        batch = [row async for row in rows.filter(id__gt=cursor).order_by('id')
+                 .values_list('id', *EXPORT_FIELDS)[:EXPORT_BATCH_SIZE]]
+        if not batch:
+            return
+        cursor = batch[-1][0]
+        buffer.seek(0)
+        buffer.truncate()
+        writer.writerows(row[1:] for row in batch)
+        yield buffer.getvalue()
+
+
+@require_GET
+async def inventory_export(request):
+    """GET /api/inventory/export.csv with the list filters, streamed a batch at a time.
+
+    Memory stays at one batch however large the inventory is, and the
+    download starts as soon as the first batch is read.
+    """
+    try:
+        rows = filter_inventory(request.GET)
+    except BadRequest as e:
+        return JsonResponse({'error': str(e)}, status=400)
+    response = StreamingHttpResponse(export_csv_chunks(rows), content_type='text/csv')
+    response['Content-Disposition'] = 'attachment; filename="inventory.csv"'
+    return response
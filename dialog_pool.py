@@ -0,0 +1,32 @@
+import tkinter as tk
+
+
+class DialogPool:
+    """Keeps each popup dialog alive between uses instead of rebuilding it.
+
+    A dialog is built the first time it is opened: build(window) lays out its
+    widgets in a fresh Toplevel and returns a reset(*args) function. Every
+    open then calls reset(*args) to clear the fields for the new use and
+    re-shows the window. Closing a dialog, by its close button or by
+    close(name), only withdraws it.
+    """
+
+    def __init__(self, root):
+        self.root = root
+        self.dialogs = {}   # name -> (Toplevel, reset)
+
+    def open(self, name, build, *args):
+        if name not in self.dialogs:
+            window = tk.Toplevel(self.root)
+            window.withdraw()
+            window.protocol("WM_DELETE_WINDOW", window.withdraw)
+            self.dialogs[name] = (window, build(window))
+        window, reset = self.dialogs[name]
+        reset(*args)
+        window.deiconify()
+        window.lift()
+        window.focus_set()
+        return window
+
+    def close(self, name):
+        self.dialogs[name][0].withdraw()
@@ -0,0 +1,167 @@
+import tkinter as tk
+from tkinter import ttk
+
+# Pixel size of one card slot in the virtualized inventory grid.
+# Rows have a fixed height, so a card lists at most CARD_QUOTES_SHOWN quotes of each
+# kind and sums up the rest; the height fits that many wrapped quote lines.
+CARD_QUOTES_SHOWN = 2
+CARD_ROW_HEIGHT = 340
+CARD_PADDING = 5
+# Canvas coordinate used to park recycled cards that have no item to show.
+OFFSCREEN = -10000
+
+
+def format_quotes(quotes, shown=CARD_QUOTES_SHOWN):
+    """The first shown quotes, one per line, then a "+K more" line for the rest."""
+    if not quotes:
+        return "N/A"
+    lines = [str(q) for q in quotes[:shown]]
+    if len(quotes) > shown:
+        lines.append(f"+{len(quotes) - shown} more")
+    return "\n".join(lines)
+
+
+def format_inventory_card(item):
+    """Return the (title, info) text shown on an inventory box."""
+    fin_options = format_quotes(item.financing_options)
+    lease_options = format_quotes(item.lease_options)
+    title = f"{item.make} {item.model} ({item.year})"
+    info = f"Type: {item.type}\nVIN: {item.vin}\nPrice: ${item.price:,.2f}\n\nFinancing:\n{fin_options}\n\nLease:\n{lease_options}"
+    return title, info
+
+
+class InventoryCard:
+    """A recyclable inventory box; show() rebinds it to another item."""
+
+    def __init__(self, parent, on_financing, on_lease):
+        self.vin = None
+        self.item = None
+        self.text = None
+        self.frame = ttk.LabelFrame(parent, text="", relief="solid")
+        # Buttons are packed first so a long quote list never clips them.
+        btn_frame = ttk.Frame(self.frame)
+        btn_frame.pack(side="bottom", padx=5, pady=5)
+        self.fin_button = ttk.Button(btn_frame, text="Add Financing", command=lambda: on_financing(self.vin))
+        self.fin_button.grid(row=0, column=0, padx=5)
+        self.lease_button = ttk.Button(btn_frame, text="Add Lease", command=lambda: on_lease(self.vin))
+        self.lease_button.grid(row=0, column=1, padx=5)
+        self.info_label = ttk.Label(self.frame, wraplength=200, justify="left", anchor="nw")
+        self.info_label.pack(fill="both", expand=True, padx=5, pady=5)
+        self.widgets = (self.frame, btn_frame, self.fin_button, self.lease_button, self.info_label)
+
+    def show(self, item):
+        self.item = item
+        self.vin = item.vin
+        text = format_inventory_card(item)
+        if text != self.text:
+            self.text = text
+            self.frame.configure(text=text[0])
+            self.info_label.configure(text=text[1])
+
+
+class VirtualInventoryGrid:
+    """Scrollable inventory grid that only creates widgets for visible rows.
+
+    Cards live as canvas windows. On scroll or resize the pool is grown to
+    cover the viewport and each card is moved to, and rebound to, the item in
+    its slot, so widget count depends on window size, not inventory size.
+    """
+
+    def __init__(self, parent, on_financing, on_lease, cols=3, row_height=CARD_ROW_HEIGHT):
+        self.on_financing = on_financing
+        self.on_lease = on_lease
+        self.cols = cols
+        self.row_height = row_height
+        self.items = []
+        self.cards = []   # list of (InventoryCard, canvas window id)
+
+        self.frame = ttk.Frame(parent)
+        self.canvas = tk.Canvas(self.frame, highlightthickness=0, yscrollincrement=20)
+        self.scrollbar = ttk.Scrollbar(self.frame, orient="vertical", command=self.yview)
+        self.canvas.configure(yscrollcommand=self.scrollbar.set)
+        self.scrollbar.pack(side="right", fill="y")
+        self.canvas.pack(side="left", fill="both", expand=True)
+        self.canvas.bind("<Configure>", lambda event: self.render())
+        self._bind_wheel(self.canvas)
+
+    def pack(self, **kwargs):
+        self.frame.pack(**kwargs)
+
+    def _bind_wheel(self, widget):
+        widget.bind("<MouseWheel>", self._on_wheel)
+        widget.bind("<Button-4>", lambda event: self.yview("scroll", -3, "units"))
+        widget.bind("<Button-5>", lambda event: self.yview("scroll", 3, "units"))
+
+    def _on_wheel(self, event):
+        self.yview("scroll", -1 if event.delta > 0 else 1, "units")
+
+    def yview(self, *args):
+        self.canvas.yview(*args)
+        self.render()
+
+    def set_items(self, items, reset_scroll=False):
+        """Show a new item list; only the rows in the viewport are rendered."""
+        self.items = list(items)
+        if reset_scroll:
+            self.canvas.yview_moveto(0)
+        self.render()
+
+    def append_item(self, item):
+        """Add one item at the end; only its own card is placed if visible."""
+        self.items.append(item)
+        self._update_scrollregion()
+        index = len(self.items) - 1
+        slot = index - self._first_visible_index()
+        if not 0 <= slot < self._visible_count():
+            return
+        if slot < len(self.cards):
+            card, window = self.cards[slot]
+            self._place(card, window, index)
+        else:
+            # The viewport has room the pool does not cover yet.
+            self.render()
+
+    def refresh_item(self, vin):
+        """Re-render the visible card for vin, if any, after its data changed."""
+        for card, window in self.cards:
+            if card.vin == vin and card.item is not None:
+                card.show(card.item)
+
+    def _update_scrollregion(self):
+        width = max(self.canvas.winfo_width(), 1)
+        height = max(self.canvas.winfo_height(), 1)
+        total_rows = (len(self.items) + self.cols - 1) // self.cols
+        self.canvas.configure(scrollregion=(0, 0, width, max(total_rows * self.row_height, height)))
+
+    def _first_visible_index(self):
+        return int(self.canvas.canvasy(0) // self.row_height) * self.cols
+
+    def _visible_count(self):
+        return (max(self.canvas.winfo_height(), 1) // self.row_height + 2) * self.cols
+
+    def _place(self, card, window, index):
+        col_width = max(self.canvas.winfo_width() // self.cols, 1)
+        row, col = divmod(index, self.cols)
+        self.canvas.coords(window, col * col_width + CARD_PADDING, row * self.row_height + CARD_PADDING)
+        self.canvas.itemconfigure(window, width=col_width - 2 * CARD_PADDING,
+                                  height=self.row_height - 2 * CARD_PADDING)
+        card.show(self.items[index])
+
+    def render(self):
+        self._update_scrollregion()
+        visible = self._visible_count()
+        while len(self.cards) < visible:
+            card = InventoryCard(self.canvas, self.on_financing, self.on_lease)
+            for widget in card.widgets:
+                self._bind_wheel(widget)
+            window = self.canvas.create_window(OFFSCREEN, OFFSCREEN, window=card.frame, anchor="nw")
+            self.cards.append((card, window))
+
+        start = self._first_visible_index()
+        for slot, (card, window) in enumerate(self.cards):
+            index = start + slot
+            if slot >= visible or index >= len(self.items):
+                self.canvas.coords(window, OFFSCREEN, OFFSCREEN)
+                card.vin = card.item = None
+                continue
+            self._place(card, window, index)
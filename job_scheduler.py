@@ -0,0 +1,139 @@
+import multiprocessing
+import queue
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+# How often the Tk side drains finished jobs while any are outstanding
+POLL_INTERVAL_MS = 30
+
+
+class JobCancelled(Exception):
+    """Raised inside a thread job by check_cancelled() once the job is cancelled."""
+
+
+class Job:
+    """Handle for one submitted job.
+
+    Thread jobs receive their Job as the first argument so they can call
+    report_progress() and check_cancelled(); callbacks always run on the Tk
+    thread, and none run after cancel().
+    """
+
+    def __init__(self, scheduler, on_done, on_error, on_progress):
+        self.scheduler = scheduler
+        self.on_done = on_done
+        self.on_error = on_error
+        self.on_progress = on_progress
+        self.future = None
+        self.cancel_event = threading.Event()
+
+    @property
+    def cancelled(self):
+        return self.cancel_event.is_set()
+
+    def cancel(self):
+        self.cancel_event.set()
+        if self.future is not None:
+            self.future.cancel()
+
+    def check_cancelled(self):
+        if self.cancel_event.is_set():
+            raise JobCancelled()
+
+    def report_progress(self, value):
+        """Called from the worker; delivered to on_progress on the Tk thread."""
+        if self.on_progress is not None and not self.cancelled:
+            self.scheduler.results.put((self, "progress", value))
+
+
+class JobScheduler:
+    """Runs work on thread or process pools and hands results back to Tk.
+
+    Workers never touch widgets: completions and progress reports go onto a
+    queue that the Tk thread drains with root.after, then the job's
+    callbacks run there.
+    """
+
+    def __init__(self, root, max_threads=4, max_processes=None):
+        self.root = root
+        self.results = queue.Queue()
+        self.thread_pool = ThreadPoolExecutor(max_workers=max_threads, thread_name_prefix="dealership-job")
+        self.max_processes = max_processes
+        self.process_pool = None   # started on the first process job
+        self.outstanding = 0
+        self.jobs = set()   # submitted and not yet drained, so shutdown() can cancel them
+        self.after_id = None
+
+    def run_in_thread(self, fn, *args, on_done=None, on_error=None, on_progress=None):
+        """Run fn(job, *args) on the thread pool and return its Job."""
+        job = Job(self, on_done, on_error, on_progress)
+        return self._submit(job, self.thread_pool, fn, job, *args)
+
+    def run_in_process(self, fn, *args, on_done=None, on_error=None):
+        """Run fn(*args) in a worker process; fn and args must be picklable."""
+        if self.process_pool is None:
+            # Spawn rather than fork: forking a Tk process with worker threads running can
+            # copy locks held by those threads into the child.
+            self.process_pool = ProcessPoolExecutor(max_workers=self.max_processes,
+                                                    mp_context=multiprocessing.get_context("spawn"))
+        job = Job(self, on_done, on_error, None)
+        return self._submit(job, self.process_pool, fn, *args)
+
+    def _submit(self, job, pool, fn, *args):
+        job.future = pool.submit(fn, *args)
+        self.outstanding += 1
+        self.jobs.add(job)
+        job.future.add_done_callback(lambda future: self.results.put((job, "finished", future)))
+        if self.after_id is None:
+            self.after_id = self.root.after(POLL_INTERVAL_MS, self._drain)
+        return job
+
+    def _drain(self):
+        self.after_id = None
+        try:
+            while True:
+                try:
+                    job, kind, value = self.results.get_nowait()
+                except queue.Empty:
+                    break
+                if kind == "finished":
+                    self.outstanding -= 1
+                    self.jobs.discard(job)
+                    self._finish(job, value)
+                elif not job.cancelled:
+                    job.on_progress(value)
+        finally:
+            # A callback that raises must not strand the results still queued behind it.
+            if self.outstanding or not self.results.empty():
+                self.after_id = self.root.after(POLL_INTERVAL_MS, self._drain)
+
+    def _finish(self, job, future):
+        if job.cancelled or future.cancelled():
+            return
+        error = future.exception()
+        if isinstance(error, JobCancelled):
+            return
+        if error is not None:
+            if job.on_error is not None:
+                job.on_error(error)
+            else:
+                print("Background job failed:", repr(error))
+        elif job.on_done is not None:
+            job.on_done(future.result())
+
+    def shutdown(self):
+        """Cancel every job and stop the pools without waiting.
+
+        Queued jobs are dropped; running thread jobs stop at their next
+        check_cancelled(), so the interpreter is not held open at exit
+        joining a worker that is still busy.
+        """
+        for job in self.jobs:
+            job.cancel()
+        self.jobs.clear()
+        if self.after_id is not None:
+            self.root.after_cancel(self.after_id)
+            self.after_id = None
+        self.thread_pool.shutdown(wait=False, cancel_futures=True)
+        if self.process_pool is not None:
+            self.process_pool.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,118 @@
+import tkinter as tk
+from collections import defaultdict
+
+# Pixel sizes of the fixed parts of the canvas week grid.
+HEADER_HEIGHT = 40
+TIME_COLUMN_WIDTH = 60
+# Minimum cell size; the grid stretches beyond this to fill the canvas.
+MIN_CELL_WIDTH = 90
+MIN_CELL_HEIGHT = 40
+BLOCK_PADDING = 2
+BLOCK_FONT = ("Helvetica", 8)
+HEADER_FONT = ("Helvetica", 9, "bold")
+
+
+class CanvasScheduleGrid:
+    """A week of time slots drawn on one canvas instead of a frame per cell.
+
+    Columns are days and rows are time slots, as in the frame grid. Each
+    appointment is a rectangle and a text item, so a busy week costs canvas
+    items rather than widgets. Appointments sharing a slot are stacked and
+    show only their first line. Clicks are hit-tested arithmetically from
+    the cell geometry, then on_click(col, row, appointment or None) is called
+    with 1-based col and row like the frame grid's cell keys.
+    """
+
+    def __init__(self, parent, time_slots, on_click=None):
+        self.time_slots = list(time_slots)
+        self.on_click = on_click
+        self.headers = []                 # header text per day column
+        self.blocks = defaultdict(list)   # (col, row) -> [(appointment, text, color)]
+        self.canvas = tk.Canvas(parent, bg="white", highlightthickness=0,
+                                width=TIME_COLUMN_WIDTH + 7 * MIN_CELL_WIDTH,
+                                height=HEADER_HEIGHT + len(self.time_slots) * MIN_CELL_HEIGHT)
+        self.canvas.bind("<Configure>", lambda event: self.redraw())
+        self.canvas.bind("<Button-1>", self._on_click)
+
+    def pack(self, **kwargs):
+        self.canvas.pack(**kwargs)
+
+    def cell_size(self):
+        cols = max(len(self.headers), 1)
+        width = max((self.canvas.winfo_width() - TIME_COLUMN_WIDTH) / cols, MIN_CELL_WIDTH)
+        height = max((self.canvas.winfo_height() - HEADER_HEIGHT) / len(self.time_slots), MIN_CELL_HEIGHT)
+        return width, height
+
+    def cell_bounds(self, col, row):
+        width, height = self.cell_size()
+        x0 = TIME_COLUMN_WIDTH + (col - 1) * width
+        y0 = HEADER_HEIGHT + (row - 1) * height
+        return x0, y0, x0 + width, y0 + height
+
+    def set_week(self, headers):
+        """Show a new week with the given day header texts and no appointments."""
+        self.headers = list(headers)
+        self.blocks.clear()
+        self.redraw()
+
+    def add_appointment(self, col, row, appointment, text, color):
+        self.blocks[(col, row)].append((appointment, text, color))
+        self._draw_cell(col, row)
+
+    def redraw(self):
+        self.canvas.delete("all")
+        width, height = self.cell_size()
+        right = TIME_COLUMN_WIDTH + len(self.headers) * width
+        bottom = HEADER_HEIGHT + len(self.time_slots) * height
+        for col, text in enumerate(self.headers, start=1):
+            x0 = TIME_COLUMN_WIDTH + (col - 1) * width
+            self.canvas.create_text(x0 + width / 2, HEADER_HEIGHT / 2, text=text, font=HEADER_FONT, justify="center")
+        for row, time_slot in enumerate(self.time_slots, start=1):
+            y0 = HEADER_HEIGHT + (row - 1) * height
+            self.canvas.create_text(TIME_COLUMN_WIDTH / 2, y0 + height / 2, text=time_slot)
+        for col in range(len(self.headers) + 1):
+            x = TIME_COLUMN_WIDTH + col * width
+            self.canvas.create_line(x, 0, x, bottom)
+        for row in range(len(self.time_slots) + 1):
+            y = HEADER_HEIGHT + row * height
+            self.canvas.create_line(0, y, right, y)
+        for col, row in self.blocks:
+            self._draw_cell(col, row)
+
+    def _draw_cell(self, col, row):
+        tag = f"cell-{col}-{row}"
+        self.canvas.delete(tag)
+        blocks = self.blocks[(col, row)]
+        x0, y0, x1, y1 = self.cell_bounds(col, row)
+        block_height = (y1 - y0) / len(blocks)
+        for i, (appointment, text, color) in enumerate(blocks):
+            top = y0 + i * block_height
+            self.canvas.create_rectangle(x0 + BLOCK_PADDING, top + BLOCK_PADDING / 2, x1 - BLOCK_PADDING,
+                                         top + block_height - BLOCK_PADDING / 2, fill=color, outline="", tags=tag)
+            label = text if len(blocks) == 1 else text.split("\n", 1)[0]
+            self.canvas.create_text((x0 + x1) / 2, top + block_height / 2, text=label, font=BLOCK_FONT,
+                                    width=x1 - x0 - 2 * BLOCK_PADDING, justify="center", tags=tag)
+
+    def cell_at(self, x, y):
+        """The (col, row) under canvas point (x, y), or None outside the cells."""
+        width, height = self.cell_size()
+        col = int((x - TIME_COLUMN_WIDTH) // width) + 1
+        row = int((y - HEADER_HEIGHT) // height) + 1
+        if x < TIME_COLUMN_WIDTH or y < HEADER_HEIGHT or col > len(self.headers) or row > len(self.time_slots):
+            return None
+        return col, row
+
+    def appointment_at(self, x, y):
+        """The appointment drawn at canvas point (x, y), or None."""
+        cell = self.cell_at(x, y)
+        blocks = self.blocks.get(cell) if cell else None
+        if not blocks:
+            return None
+        x0, y0, x1, y1 = self.cell_bounds(*cell)
+        index = min(int((y - y0) / ((y1 - y0) / len(blocks))), len(blocks) - 1)
+        return blocks[index][0]
+
+    def _on_click(self, event):
+        cell = self.cell_at(event.x, event.y)
+        if cell is not None and self.on_click is not None:
+            self.on_click(cell[0], cell[1], self.appointment_at(event.x, event.y))